@@ -1,61 +1,413 @@
 """Module-level cache for session data to reduce state serialization"""
 
-from typing import Dict, Set, Optional
-from datetime import datetime
-from inspector_claude.indexer import Session
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from inspector_claude.indexer import Session, load_agent_session, load_session_messages
+import rxconfig
+
+# Maximum number of sessions (including agent side-chains) kept in the hot
+# tier with strong references. Least-recently-used entries are demoted to
+# the weak cold tier once this limit is exceeded, bounding resident memory
+# to roughly this many sessions' worth of messages.
+MAX_CACHED_SESSIONS = 16
+
+# Background sweep: inserts are unconditional, and a periodic sweeper trims
+# the hot tier back down to the low-water mark whenever it has grown past
+# the high-water mark, batching demotion work off the insert path.
+SWEEP_INTERVAL_SECONDS = 30.0
+HIGH_WATER_SESSIONS = MAX_CACHED_SESSIONS
+LOW_WATER_SESSIONS = MAX_CACHED_SESSIONS * 3 // 4
+
+# How long a cached file mtime stays trusted before the caller is asked to
+# re-stat. Keeps staleness checks correct when files change externally
+# without requiring a full clear_cache + reindex.
+MTIME_TTL_SECONDS = 1.0
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """A single cache entry bundling a session with its bookkeeping"""
+    session: Session
+    loaded: bool = False  # True once messages are loaded (not just metadata)
+    load_time: Optional[float] = None  # Epoch seconds, comparable to file mtimes
+    mtime: Optional[float] = None  # Cached file modification time
+    mtime_cached_at: Optional[float] = None  # When the mtime was cached (monotonic)
+    msg_count: int = 0  # Message count at insert time, for the running total
+
+
+def _locate_session_stub(session_id: str) -> Optional[Session]:
+    """Find a session file on disk and build a bare Session stub for it"""
+    projects_dir = rxconfig.claude_dir / "projects"
+    filename = f"{session_id}.jsonl"
+    try:
+        with os.scandir(projects_dir) as project_dirs:
+            for project_dir in project_dirs:
+                if project_dir.is_dir() and os.path.exists(os.path.join(project_dir.path, filename)):
+                    return Session(session_id=session_id, project_path="",
+                                   project_dir=project_dir.name)
+    except OSError:
+        pass
+    return None
+
+
+class _SessionStore(OrderedDict):
+    """Hot-tier store whose __missing__ loads sessions on demand
+
+    Lets callers collapse the check-cache-then-load idiom into a single
+    store[session_id]; the lookup and miss dispatch both happen in one
+    C-level dict call. The owning slab is attached as `.slab` so the miss
+    path can reach the cold tier it belongs with.
+    """
+
+    def __missing__(self, key: str) -> _CacheEntry:
+        slab = self.slab
+        # The whole miss path runs under the slab lock: it mutates the hot
+        # tier, both cold tiers and the incremental counters, and it runs
+        # on worker threads concurrently with the sweep timer's demotion.
+        # Holding the lock across the disk parse also means two threads
+        # missing on the same key load it once, not twice.
+        with slab.lock:
+            entry = OrderedDict.get(self, key)
+            if entry is not None:
+                # Another thread inserted the key while we waited
+                return entry
+            session = slab.cold.get(key)
+            if session is None:
+                session = _locate_session_stub(key)
+            if session is None:
+                raise KeyError(key)
+            if not session.messages_loaded:
+                session.messages = load_session_messages(key, session.project_dir)
+                session.invalidate_message_caches()
+                session.messages_loaded = True
+            load_time, mtime, mtime_cached_at = slab.cold_meta.pop(key, (None, None, None))
+            entry = self[key] = _CacheEntry(
+                session=session, loaded=True,
+                load_time=load_time if load_time is not None else time.time(),
+                mtime=mtime, mtime_cached_at=mtime_cached_at)
+            slab.cold.pop(key, None)
+            slab.loaded_count += 1
+            _set_entry_count(entry)
+        _schedule_sweep()
+        return entry
+
+
+class SessionCacheSlab:
+    """All cache tiers and bookkeeping, bundled into one swappable instance
+
+    Grouping the tiers on one object keeps their lifetimes aligned:
+    clear_cache rebinds a single module global and every tier plus its
+    bookkeeping is replaced together, so no code path can pair a fresh hot
+    tier with stale cold-tier metadata. Per-thread slabs with a periodic
+    merge to a shared L2 were considered and rejected: event handlers, the
+    file watcher, and background loads must all observe each other's cached
+    sessions immediately, and under the GIL the shared dict sees none of
+    the cross-core contention that a thread-local split would address.
+    """
 
-# Module-level cache (shared across all state instances)
-# These variables are NOT part of State, so they don't get serialized to frontend
-_session_cache: Dict[str, Session] = {}
-_loaded_sessions: Set[str] = set()
-_session_load_times: Dict[str, datetime] = {}
-_file_mtimes: Dict[str, float] = {}
+    __slots__ = ('hot', 'cold', 'cold_meta', 'total_messages',
+                 'loaded_count', 'lock', 'sweep_timer')
+
+    def __init__(self) -> None:
+        # Hot tier, ordered oldest-access-first so eviction pops from the
+        # front in O(1)
+        self.hot: _SessionStore = _SessionStore()
+        self.hot.slab = self
+        # Cold tier: sessions held through weak references, so anything not
+        # also referenced elsewhere can be reclaimed by the GC instead of
+        # being pinned. Holds both metadata-only stubs and fully-loaded
+        # sessions demoted from the hot tier.
+        self.cold: "weakref.WeakValueDictionary[str, Session]" = weakref.WeakValueDictionary()
+        # Bookkeeping (load time, mtime) for demoted sessions, so promotion
+        # can restore it. Plain floats only, so this pins no session data.
+        self.cold_meta: Dict[str, Tuple[Optional[float], Optional[float], Optional[float]]] = {}
+        # Running total of messages in the hot tier, maintained
+        # incrementally so get_cache_stats doesn't rescan per call
+        self.total_messages: int = 0
+        # How many hot entries have messages loaded, likewise incremental
+        self.loaded_count: int = 0
+        # Guards multi-step cache writes so concurrent handlers can't
+        # observe a half-updated entry. Reads stay lock-free: a single
+        # dict probe is atomic under CPython.
+        self.lock = threading.RLock()
+        self.sweep_timer: Optional[threading.Timer] = None
+
+
+# The process-wide slab, shared across all state instances. This is NOT
+# part of State, so it doesn't get serialized to frontend.
+_slab: SessionCacheSlab = SessionCacheSlab()
+
+
+def _demote_lru(target: int) -> None:
+    """Demote least-recently-used entries until the hot tier is at target size
+
+    Demotion only drops the hot tier's strong reference: the Session
+    object itself is never mutated, since other owners (the UI, agent
+    loaders) may still hold it. Anything still referenced stays reachable
+    through the weak cold tier and can be promoted back; anything
+    unreferenced is reclaimed by the GC.
+
+    Caller must hold the slab lock.
+    """
+    slab = _slab
+    while len(slab.hot) > target:
+        session_id, evicted = slab.hot.popitem(last=False)
+        slab.total_messages -= evicted.msg_count
+        if evicted.loaded:
+            slab.loaded_count -= 1
+        slab.cold[session_id] = evicted.session
+        slab.cold_meta[session_id] = (evicted.load_time, evicted.mtime, evicted.mtime_cached_at)
+    # Drop bookkeeping for cold sessions the GC has already reclaimed
+    if len(slab.cold_meta) > 8 * MAX_CACHED_SESSIONS:
+        slab.cold_meta = {k: v for k, v in slab.cold_meta.items() if k in slab.cold}
+
+
+def _sweep_cache() -> None:
+    """Trim the hot tier back to the low-water mark, then reschedule"""
+    _slab.sweep_timer = None
+    with _slab.lock:
+        if len(_slab.hot) > HIGH_WATER_SESSIONS:
+            _demote_lru(LOW_WATER_SESSIONS)
+    _schedule_sweep()
+
+
+def _schedule_sweep() -> None:
+    """Start the background sweep timer if it isn't already running"""
+    if _slab.sweep_timer is None:
+        timer = threading.Timer(SWEEP_INTERVAL_SECONDS, _sweep_cache)
+        timer.daemon = True
+        _slab.sweep_timer = timer
+        timer.start()
+
+
+def _set_entry_count(entry: _CacheEntry) -> None:
+    """Refresh an entry's message count and the running cache-wide total"""
+    count = len(entry.session.messages) if entry.session.messages else 0
+    _slab.total_messages += count - entry.msg_count
+    entry.msg_count = count
+
+
+def get_entry(session_id: str) -> Optional[_CacheEntry]:
+    """Get the full cache entry for a session in a single lookup
+
+    Callers that need several facts about a session (the object itself,
+    whether messages are loaded, load time, mtime) should fetch the entry
+    once instead of going through the per-field accessors repeatedly.
+    """
+    entry = _slab.hot.get(session_id)
+    if entry is not None:
+        try:
+            _slab.hot.move_to_end(session_id)
+        except KeyError:
+            # The sweep demoted the entry between the probe and the LRU
+            # bump; the entry object itself is still valid, only the
+            # recency update is lost
+            pass
+        return entry
+
+    # Fall back to the cold tier; fully-loaded sessions are promoted back
+    # into the hot tier, metadata stubs come back as a transient entry
+    session = _slab.cold.get(session_id)
+    if session is None:
+        return None
+    if not session.messages_loaded:
+        return _CacheEntry(session=session)
+    with _slab.lock:
+        entry = _slab.hot.get(session_id)
+        if entry is not None:
+            # Another thread promoted the key while we waited; counting
+            # the promotion twice would drift the incremental counters
+            return entry
+        load_time, mtime, mtime_cached_at = _slab.cold_meta.pop(session_id, (None, None, None))
+        entry = _slab.hot[session_id] = _CacheEntry(
+            session=session, loaded=True, load_time=load_time,
+            mtime=mtime, mtime_cached_at=mtime_cached_at)
+        _slab.loaded_count += 1
+        _set_entry_count(entry)
+    _schedule_sweep()
+    return entry
 
 
 def get_session(session_id: str) -> Optional[Session]:
     """Get session from cache"""
-    return _session_cache.get(session_id)
+    entry = get_entry(session_id)
+    return entry.session if entry is not None else None
 
 
 def store_session_metadata(session_id: str, session: Session) -> None:
     """Store session in cache WITHOUT messages (metadata only)"""
-    _session_cache[session_id] = session
-    # Do NOT add to _loaded_sessions - messages not loaded yet!
+    with _slab.lock:
+        entry = _slab.hot.get(session_id)
+        if entry is not None:
+            # Keep the cached mtime; this is a metadata refresh, not a load
+            entry.session = session
+            if entry.loaded:
+                _slab.loaded_count -= 1
+            entry.loaded = False
+            entry.load_time = None
+            _set_entry_count(entry)
+        else:
+            # Metadata-only sessions live in the weak tier until promoted
+            _slab.cold[session_id] = session
+
+
+def cache_session(session_id: str, session: Session, load_time: Optional[float] = None) -> None:
+    """Store session in cache with messages loaded
 
+    Args:
+        session_id: The session ID
+        session: The Session object with messages populated
+        load_time: Epoch seconds when messages were loaded (defaults to now).
+            Kept as a plain float so staleness checks compare directly
+            against file mtimes without constructing datetime objects.
+    """
+    if load_time is None:
+        load_time = time.time()
+    session.messages_loaded = True
+    with _slab.lock:
+        entry = _slab.hot.get(session_id)
+        if entry is not None:
+            entry.session = session
+            if not entry.loaded:
+                _slab.loaded_count += 1
+            entry.loaded = True
+            entry.load_time = load_time
+            _slab.hot.move_to_end(session_id)
+        else:
+            entry = _slab.hot[session_id] = _CacheEntry(session=session, loaded=True, load_time=load_time)
+            _slab.loaded_count += 1
+        _slab.cold.pop(session_id, None)  # Promoted to the strong tier
+        _set_entry_count(entry)
+    _schedule_sweep()
+
+
+def load_session(session_id: str) -> Optional[Session]:
+    """Get a session with messages loaded, loading from disk on a miss
+
+    One store subscript covers every case: hot hit, cold-tier promotion,
+    and a full disk load for sessions the cache has never seen.
 
-def cache_session(session_id: str, session: Session, load_time: datetime) -> None:
-    """Store session in cache with messages loaded"""
-    _session_cache[session_id] = session
-    _loaded_sessions.add(session_id)
-    _session_load_times[session_id] = load_time
+    Returns:
+        Session with messages, or None if no session file exists
+    """
+    try:
+        entry = _slab.hot[session_id]
+    except KeyError:
+        return None
+    if entry.loaded:
+        _slab.hot.move_to_end(session_id)
+    else:
+        # Hot entry holding metadata only: load messages in place. Locked
+        # for the same reason as the miss path, and re-checked in case a
+        # concurrent caller finished the load while we waited.
+        with _slab.lock:
+            if not entry.loaded:
+                session = entry.session
+                session.messages = load_session_messages(session_id, session.project_dir)
+                session.invalidate_message_caches()
+                session.messages_loaded = True
+                entry.loaded = True
+                entry.load_time = time.time()
+                _slab.loaded_count += 1
+                _set_entry_count(entry)
+    return entry.session
 
 
 def is_session_loaded(session_id: str) -> bool:
     """Check if session messages are loaded in cache"""
-    return session_id in _loaded_sessions
+    entry = _slab.hot.get(session_id)
+    return entry is not None and entry.loaded
 
 
-def get_load_time(session_id: str) -> Optional[datetime]:
-    """Get when session messages were loaded"""
-    return _session_load_times.get(session_id)
+def get_load_time(session_id: str) -> Optional[float]:
+    """Get when session messages were loaded (epoch seconds)"""
+    entry = _slab.hot.get(session_id)
+    return entry.load_time if entry is not None else None
 
 
 def cache_file_mtime(session_id: str, mtime: float) -> None:
     """Cache file modification time to avoid repeated stat() calls"""
-    _file_mtimes[session_id] = mtime
+    entry = _slab.hot.get(session_id)
+    if entry is not None:
+        entry.mtime = mtime
+        entry.mtime_cached_at = time.monotonic()
 
 
-def get_cached_mtime(session_id: str) -> Optional[float]:
-    """Get cached file modification time"""
-    return _file_mtimes.get(session_id)
+def get_cached_mtime(session_id: str, ttl: float = MTIME_TTL_SECONDS) -> Optional[float]:
+    """Get cached file modification time, or None if missing or stale
+
+    Entries older than ttl seconds are treated as misses so the caller
+    re-stats the file and refreshes the cache via cache_file_mtime.
+    """
+    entry = _slab.hot.get(session_id)
+    if entry is None or entry.mtime is None:
+        return None
+    if entry.mtime_cached_at is None or time.monotonic() - entry.mtime_cached_at > ttl:
+        return None
+    return entry.mtime
+
+
+def refresh_mtimes_from_dir(dir_path) -> int:
+    """Batch-refresh cached mtimes for every session file in a project dir
+
+    One scandir pass replaces a stat() call per session file: scandir's
+    DirEntry.stat() reuses data fetched while reading the directory, so
+    staleness checks afterwards hit a warm cache instead of doing file I/O.
+
+    Args:
+        dir_path: Path to an encoded project directory
+
+    Returns:
+        Number of cached sessions whose mtime was refreshed
+    """
+    refreshed = 0
+    try:
+        with os.scandir(dir_path) as entries:
+            for dir_entry in entries:
+                name = dir_entry.name
+                if not name.endswith('.jsonl') or name.startswith('agent-'):
+                    continue
+                cached = _slab.hot.get(name[:-6])  # Strip ".jsonl"
+                if cached is not None:
+                    cached.mtime = dir_entry.stat().st_mtime
+                    cached.mtime_cached_at = time.monotonic()
+                    refreshed += 1
+    except OSError:
+        pass
+    return refreshed
 
 
 def clear_cache() -> None:
-    """Clear all cached data"""
-    _session_cache.clear()
-    _loaded_sessions.clear()
-    _session_load_times.clear()
-    _file_mtimes.clear()
+    """Clear all cached data
+
+    Swaps in a fresh slab instead of clearing tier by tier: every
+    container plus its bookkeeping is replaced in one rebind, and the old
+    slab becomes unreachable and is reclaimed by the GC off this hot path.
+    """
+    global _slab
+    old = _slab
+    if old.sweep_timer is not None:
+        old.sweep_timer.cancel()
+    _slab = SessionCacheSlab()
+
+
+# Memoized composite keys so repeated agent cache touches (e.g. UI polling)
+# don't allocate a fresh string per call
+_agent_key_cache: Dict[Tuple[str, str], str] = {}
+
+
+def _agent_cache_key(agent_id: str, parent_session_id: str) -> str:
+    """Build the composite cache key for an agent side-chain"""
+    pair = (parent_session_id, agent_id)
+    key = _agent_key_cache.get(pair)
+    if key is None:
+        key = _agent_key_cache[pair] = f"{parent_session_id}:agent:{agent_id}"
+    return key
 
 
 def store_agent_session(agent_id: str, parent_session_id: str, session: Session) -> None:
@@ -66,11 +418,44 @@ def store_agent_session(agent_id: str, parent_session_id: str, session: Session)
         parent_session_id: The parent session ID
         session: The agent Session object
     """
-    # Use composite key for agents
-    cache_key = f"{parent_session_id}:agent:{agent_id}"
-    _session_cache[cache_key] = session
-    _loaded_sessions.add(cache_key)
-    _session_load_times[cache_key] = datetime.now()
+    cache_key = _agent_cache_key(agent_id, parent_session_id)
+    with _slab.lock:
+        previous = _slab.hot.get(cache_key)
+        if previous is not None:
+            _slab.total_messages -= previous.msg_count
+        else:
+            _slab.loaded_count += 1
+        entry = _slab.hot[cache_key] = _CacheEntry(session=session, loaded=True, load_time=time.time())
+        _set_entry_count(entry)
+    _schedule_sweep()
+
+
+def load_agent_session_cached(agent_id: str, parent_session_id: str, project_dir: str) -> Optional[Session]:
+    """Get an agent session, loading from disk on first access
+
+    Served entirely from the slab tiers: a hot hit or cold-tier promotion
+    returns the cached object, and a miss loads from disk and stores the
+    result under the composite key. Keeping the slab as the single owner
+    means eviction sees every cached reference; a separate memo layer
+    would keep sessions alive (and aliased) behind eviction's back.
+
+    Args:
+        agent_id: The agent ID
+        parent_session_id: The parent session ID
+        project_dir: Encoded project directory of the parent session
+
+    Returns:
+        Session object, or None if the agent file doesn't exist
+    """
+    cache_key = _agent_cache_key(agent_id, parent_session_id)
+    session = get_session(cache_key)
+    if session is not None and session.messages_loaded:
+        return session
+    session = load_agent_session(agent_id, project_dir)
+    if session is None:
+        return None
+    store_agent_session(agent_id, parent_session_id, session)
+    return session
 
 
 def get_agent_session(agent_id: str, parent_session_id: str) -> Optional[Session]:
@@ -83,8 +468,7 @@ def get_agent_session(agent_id: str, parent_session_id: str) -> Optional[Session
     Returns:
         Session object if cached, else None
     """
-    cache_key = f"{parent_session_id}:agent:{agent_id}"
-    return _session_cache.get(cache_key)
+    return get_session(_agent_cache_key(agent_id, parent_session_id))
 
 
 def is_agent_loaded(agent_id: str, parent_session_id: str) -> bool:
@@ -97,20 +481,15 @@ def is_agent_loaded(agent_id: str, parent_session_id: str) -> bool:
     Returns:
         True if agent is loaded, False otherwise
     """
-    cache_key = f"{parent_session_id}:agent:{agent_id}"
-    return cache_key in _loaded_sessions
+    return is_session_loaded(_agent_cache_key(agent_id, parent_session_id))
 
 
 def get_cache_stats() -> dict:
     """Get cache statistics for debugging"""
-    total_messages = sum(
-        len(s.messages) if s.messages else 0
-        for s in _session_cache.values()
-    )
-
     return {
-        'sessions_cached': len(_session_cache),
-        'sessions_with_messages': len(_loaded_sessions),
-        'total_messages_in_cache': total_messages,
-        'memory_estimate_mb': total_messages * 2 / 1024  # Rough: 2KB per message
+        'sessions_cached': len(_slab.hot),
+        'sessions_metadata_only': len(_slab.cold),
+        'sessions_with_messages': _slab.loaded_count,
+        'total_messages_in_cache': _slab.total_messages,
+        'memory_estimate_mb': _slab.total_messages * 2 / 1024  # Rough: 2KB per message
     }
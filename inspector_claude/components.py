@@ -1,11 +1,78 @@
 """UI components for Inspector Claude"""
 
+import functools
+
 import reflex as rx
 from typing import Optional, Dict
 from inspector_claude.state import State, SessionSummary
 from inspector_claude.config import COLORS
 
-
+# COLORS entries bound once at import so component builds do attribute-free
+# global loads instead of a dict lookup per reference
+_SELECTED_SESSION_BG = COLORS['selected_session_bg']
+_SELECTED_SESSION_BORDER = COLORS['selected_session_border']
+_THINKING_BG = COLORS['thinking_bg']
+_THINKING_BORDER = COLORS['thinking_border']
+_TOOL_USE_BG = COLORS['tool_use_bg']
+_TOOL_USE_BORDER = COLORS['tool_use_border']
+_TOOL_RESULT_BG = COLORS['tool_result_bg']
+_TOOL_RESULT_BORDER = COLORS['tool_result_border']
+_FILE_HISTORY_BG = COLORS['file_history_bg']
+_FILE_HISTORY_BORDER = COLORS['file_history_border']
+_SESSION_SUMMARY_BG = COLORS['session_summary_bg']
+_SESSION_SUMMARY_BORDER = COLORS['session_summary_border']
+_USER_MESSAGE_BG = COLORS['user_message_bg']
+
+# Shared empty component for "render nothing" branches; one instance
+# instead of a fresh rx.box() allocation per cond per render
+_EMPTY_BOX = rx.box()
+
+
+def _block_style(background_color: str, border_color: str) -> Dict:
+    """Build the full container style for one styled_content_block kind"""
+    return {
+        "display": "grid",
+        "grid_template_rows": "auto 1fr",
+        "row_gap": "8px",
+        "justify_items": "start",
+        "padding": "12px",
+        "border_radius": "6px",
+        "background_color": background_color,
+        "border": f"1px solid {border_color}",
+        "width": "100%",
+        "max_width": "100%",
+    }
+
+
+# Per-kind block styles built once at import; render_* functions pass these
+# instead of rebuilding the same dict (and border f-string) on every call
+_THINKING_BLOCK_STYLE = _block_style(_THINKING_BG, _THINKING_BORDER)
+_TOOL_USE_BLOCK_STYLE = _block_style(_TOOL_USE_BG, _TOOL_USE_BORDER)
+_TOOL_RESULT_BLOCK_STYLE = _block_style(_TOOL_RESULT_BG, _TOOL_RESULT_BORDER)
+_FILE_HISTORY_BLOCK_STYLE = _block_style(_FILE_HISTORY_BG, _FILE_HISTORY_BORDER)
+_IMAGE_BLOCK_STYLE = _block_style("#faf5ff", "#e9d5ff")
+_AGENT_INVOCATION_BLOCK_STYLE = _block_style("#eff6ff", "#93c5fd")
+
+# Child selector that scopes horizontal overflow to the content slot
+_BLOCK_OVERFLOW_STYLE = {"& > *:last-child": {"max_width": "100%", "overflow_x": "auto"}}
+
+# session_card container styles for the selected/unselected states
+_SELECTED_CARD_STYLE = {
+    "background_color": _SELECTED_SESSION_BG,
+    "cursor": "pointer",
+    "border": f"2px solid {_SELECTED_SESSION_BORDER}",
+    "content_visibility": "auto",
+    "contain_intrinsic_size": "auto 180px"
+}
+_UNSELECTED_CARD_STYLE = {
+    "cursor": "pointer",
+    "border": "2px solid transparent",
+    "content_visibility": "auto",
+    "contain_intrinsic_size": "auto 180px"
+}
+
+
+@rx.memo
 def session_card(session: SessionSummary) -> rx.Component:
     """Render a session summary card"""
     return rx.card(
@@ -14,19 +81,19 @@ def session_card(session: SessionSummary) -> rx.Component:
                 session.description,
                 size="4"
             ),
-            rx.text(f"ID: {session.session_id}", size="1", color="gray"),
-            rx.text(f"Project: {session.project_path}", size="2"),
-            rx.text(f"Branch: {session.git_branch}", size="2"),
+            rx.text(session.id_display, size="1", color="gray"),
+            rx.text(session.project_display, size="2"),
+            rx.text(session.branch_display, size="2"),
             rx.hstack(
-                rx.badge(f"{session.message_count} messages", color_scheme="blue"),
-                rx.badge(f"{session.total_tokens} total tokens", color_scheme="green"),
+                rx.badge(session.message_count_label, color_scheme="blue"),
+                rx.badge(session.total_tokens_label, color_scheme="green"),
             ),
             rx.hstack(
-                rx.badge(f"{session.input_tokens} in", color_scheme="cyan"),
-                rx.badge(f"{session.output_tokens} out", color_scheme="orange"),
+                rx.badge(session.input_tokens_label, color_scheme="cyan"),
+                rx.badge(session.output_tokens_label, color_scheme="orange"),
             ),
             rx.text(
-                f"Started: {session.start_time}",
+                session.start_time_label,
                 size="1",
                 color="gray"
             ),
@@ -36,10 +103,13 @@ def session_card(session: SessionSummary) -> rx.Component:
         ),
         width="100%",
         on_click=lambda: State.select_session(session.session_id),
+        # content-visibility lets the browser skip layout and paint for
+        # cards scrolled out of the sidebar; the intrinsic-size placeholder
+        # keeps the scrollbar stable with hundreds of sessions indexed
         style=rx.cond(
             State.selected_session_id == session.session_id,
-            {"background_color": COLORS['selected_session_bg'], "cursor": "pointer", "border": f"2px solid {COLORS['selected_session_border']}"},
-            {"cursor": "pointer", "border": "2px solid transparent"}
+            _SELECTED_CARD_STYLE,
+            _UNSELECTED_CARD_STYLE
         )
     )
 
@@ -48,8 +118,7 @@ def styled_content_block(
     badge_text: str,
     badge_color: str,
     content: rx.Component,
-    background_color: str,
-    border_color: str,
+    block_style: Dict,
     header_extras: Optional[rx.Component] = None
 ) -> rx.Component:
     """Create a styled content block with consistent styling
@@ -58,37 +127,28 @@ def styled_content_block(
         badge_text: Text to display in the badge
         badge_color: Color scheme for the badge
         content: The content component to display
-        background_color: Background color for the block
-        border_color: Border color for the block
+        block_style: Precomputed container style (one of the module-level
+            _*_BLOCK_STYLE constants)
         header_extras: Optional additional components for the header (e.g., buttons)
     """
+    # One grid container instead of box > vstack > (hstack, box) nesting:
+    # blocks render by the hundred, so every wrapper element multiplies
+    # DOM size and flex layout work. The child selector keeps horizontal
+    # overflow scoped to the content slot without a wrapper element.
     return rx.box(
-        rx.vstack(
-            rx.hstack(
-                rx.badge(badge_text, color_scheme=badge_color, size="1"),
-                header_extras if header_extras else rx.box(),
-                width="100%",
-                align_items="center"
-            ),
-            rx.box(
-                content,
-                width="100%",
-                max_width="100%",
-                overflow_x="auto"
-            ),
-            spacing="2",
-            align_items="start",
-            width="100%"
+        rx.hstack(
+            rx.badge(badge_text, color_scheme=badge_color, size="1"),
+            header_extras if header_extras else _EMPTY_BOX,
+            width="100%",
+            align_items="center"
         ),
-        padding="12px",
-        border_radius="6px",
-        background_color=background_color,
-        border=f"1px solid {border_color}",
-        width="100%",
-        max_width="100%"
+        content,
+        **block_style,
+        style=_BLOCK_OVERFLOW_STYLE
     )
 
 
+@rx.memo
 def render_text_block(block: Dict) -> rx.Component:
     """Render a text content block"""
     return rx.box(
@@ -98,6 +158,7 @@ def render_text_block(block: Dict) -> rx.Component:
     )
 
 
+@rx.memo
 def render_thinking_block(block: Dict) -> rx.Component:
     """Render a thinking content block"""
     content = rx.text(
@@ -110,11 +171,11 @@ def render_thinking_block(block: Dict) -> rx.Component:
         badge_text="Thinking",
         badge_color="purple",
         content=content,
-        background_color=COLORS['thinking_bg'],
-        border_color=COLORS['thinking_border']
+        block_style=_THINKING_BLOCK_STYLE
     )
 
 
+@rx.memo
 def render_tool_use_block(block: Dict) -> rx.Component:
     """Render a tool_use content block"""
     header_extras = rx.text("ID: ", block["id_short"], "...", size="1", color="gray")
@@ -129,19 +190,19 @@ def render_tool_use_block(block: Dict) -> rx.Component:
         badge_text=f"Tool: {block['name']}",
         badge_color="green",
         content=content,
-        background_color=COLORS['tool_use_bg'],
-        border_color=COLORS['tool_use_border'],
+        block_style=_TOOL_USE_BLOCK_STYLE,
         header_extras=header_extras
     )
 
 
+@rx.memo
 def render_tool_result_block(block: Dict) -> rx.Component:
     """Render a tool_result content block with expand/collapse functionality"""
-    tool_use_id = block["tool_use_id"]
+    result_idx = block["tool_result_idx"]
     content = block["content"]
     content_preview = block["content_preview"]
     is_long = block["is_long"]
-    is_expanded = State.expanded_tool_results.contains(tool_use_id)
+    is_expanded = State.expanded_tool_results.contains(result_idx)
 
     # Build header with ID and optional expand/collapse button
     header_extras = rx.hstack(
@@ -151,45 +212,37 @@ def render_tool_result_block(block: Dict) -> rx.Component:
             is_long,
             rx.button(
                 rx.cond(is_expanded, "Show less", "Show more"),
-                on_click=lambda: State.toggle_tool_result_expansion(tool_use_id),
+                on_click=lambda: State.toggle_tool_result_expansion(result_idx),
                 size="1",
                 variant="soft",
                 color_scheme="cyan"
             ),
-            rx.box()
+            _EMPTY_BOX
         )
     )
 
-    # Content with conditional display
-    content_component = rx.cond(
-        is_expanded | ~is_long,
-        rx.text(
-            content,
-            size="2",
-            white_space="pre-wrap",
-            word_break="break-word",
-            font_family="monospace"
-        ),
-        rx.text(
-            content_preview,
-            size="2",
-            white_space="pre-wrap",
-            word_break="break-word",
-            font_family="monospace",
-            color="#555"
-        )
+    # One text node whose value and color switch, instead of two full
+    # rx.text subtrees behind a cond that React must reconcile both of
+    show_full = is_expanded | ~is_long
+    content_component = rx.text(
+        rx.cond(show_full, content, content_preview),
+        size="2",
+        white_space="pre-wrap",
+        word_break="break-word",
+        font_family="monospace",
+        color=rx.cond(show_full, "inherit", "#555")
     )
 
     return styled_content_block(
         badge_text="Tool Result",
         badge_color="cyan",
         content=content_component,
-        background_color=COLORS['tool_result_bg'],
-        border_color=COLORS['tool_result_border'],
+        block_style=_TOOL_RESULT_BLOCK_STYLE,
         header_extras=header_extras
     )
 
 
+@rx.memo
 def render_file_history_block(block: Dict) -> rx.Component:
     """Render a file-history-snapshot content block"""
     # File history blocks typically contain file content or file metadata
@@ -205,11 +258,11 @@ def render_file_history_block(block: Dict) -> rx.Component:
         badge_text="File History Snapshot",
         badge_color="orange",
         content=content,
-        background_color=COLORS['file_history_bg'],
-        border_color=COLORS['file_history_border']
+        block_style=_FILE_HISTORY_BLOCK_STYLE
     )
 
 
+@rx.memo
 def render_image_block(block: Dict) -> rx.Component:
     """Render an image content block"""
     # Image source data is flattened by the indexer into top-level fields:
@@ -228,7 +281,9 @@ def render_image_block(block: Dict) -> rx.Component:
             max_width="100%",
             max_height="600px",
             object_fit="contain",
-            border_radius="4px"
+            border_radius="4px",
+            # Defer decode until the image nears the viewport
+            custom_attrs={"loading": "lazy", "decoding": "async"}
         ),
         rx.cond(
             block["source_type"] == "url",
@@ -239,7 +294,8 @@ def render_image_block(block: Dict) -> rx.Component:
                 max_width="100%",
                 max_height="600px",
                 object_fit="contain",
-                border_radius="4px"
+                border_radius="4px",
+                custom_attrs={"loading": "lazy", "decoding": "async"}
             ),
             # Fallback for unknown source type
             rx.text(
@@ -255,37 +311,11 @@ def render_image_block(block: Dict) -> rx.Component:
         badge_text="Image",
         badge_color="violet",
         content=content,
-        background_color="#faf5ff",
-        border_color="#e9d5ff"
-    )
-
-
-def render_unknown_block(block: Dict) -> rx.Component:
-    """Render an unknown content block type with generic styling"""
-    block_type = block.get("type", "unknown")
-    raw_content = block.get("content", "")
-
-    # Convert content to string if it's not already
-    if not isinstance(raw_content, str):
-        raw_content = str(raw_content)
-
-    content = rx.text(
-        raw_content,
-        size="2",
-        white_space="pre-wrap",
-        word_break="break-word"
-    )
-
-    return styled_content_block(
-        badge_text=f"Unknown Type: {block_type}",
-        badge_color="gray",
-        content=content,
-        background_color=COLORS['unknown_bg'],
-        border_color=COLORS['unknown_border']
+        block_style=_IMAGE_BLOCK_STYLE
     )
 
 
-def render_agent_invocation_block(block: Dict, agent_metadata) -> rx.Component:
+def render_agent_invocation_block(agent_metadata) -> rx.Component:
     """Render a Task tool_use block with agent information
 
     Shows agent ID, status, summary, and button to open agent history
@@ -347,7 +377,7 @@ def render_agent_invocation_block(block: Dict, agent_metadata) -> rx.Component:
                 align_items="start",
                 width="100%"
             ),
-            rx.box()
+            _EMPTY_BOX
         ),
 
         # Stats and button
@@ -384,14 +414,18 @@ def render_agent_invocation_block(block: Dict, agent_metadata) -> rx.Component:
         badge_text="🤖 Tool: Task",
         badge_color="blue",
         content=content,
-        background_color="#eff6ff",
-        border_color="#93c5fd",
+        block_style=_AGENT_INVOCATION_BLOCK_STYLE,
         header_extras=header_extras
     )
 
 
+@functools.cache
 def agent_view_header() -> rx.Component:
-    """Header shown when viewing an agent side-chain"""
+    """Header shown when viewing an agent side-chain
+
+    Structure depends only on State vars, so the component tree is built
+    exactly once and reused across session_detail rebuilds.
+    """
     from inspector_claude.state import State
 
     return rx.box(
@@ -423,32 +457,21 @@ def agent_view_header() -> rx.Component:
 
 def render_content_block(block: Dict) -> rx.Component:
     """Render a single content block based on its type"""
-    # Check each type and render accordingly
-    return rx.cond(
-        block["type"] == "text",
-        render_text_block(block),
-        rx.cond(
-            block["type"] == "thinking",
-            render_thinking_block(block),
-            rx.cond(
-                block["type"] == "tool_use",
-                render_tool_use_block(block),
-                rx.cond(
-                    block["type"] == "tool_result",
-                    render_tool_result_block(block),
-                    rx.cond(
-                        block["type"] == "file-history-snapshot",
-                        render_file_history_block(block),
-                        rx.cond(
-                            block["type"] == "image",
-                            render_image_block(block),
-                            # Unknown block type
-                            rx.box()
-                        )
-                    )
-                )
-            )
-        )
+    # Single switch on the block type: one rx.match compiles to a flat
+    # dispatch instead of six nested ternaries per block. The parser
+    # whitelists block types into content_blocks, so the default arm is
+    # unreachable for indexed data and exists only as a compile-time
+    # fallback.
+    return rx.match(
+        block["type"],
+        ("text", render_text_block(block=block)),
+        ("thinking", render_thinking_block(block=block)),
+        ("tool_use", render_tool_use_block(block=block)),
+        ("tool_result", render_tool_result_block(block=block)),
+        ("file-history-snapshot", render_file_history_block(block=block)),
+        ("image", render_image_block(block=block)),
+        # Unknown block type
+        _EMPTY_BOX
     )
 
 
@@ -456,48 +479,65 @@ def render_agent_card_if_present(msg) -> rx.Component:
     """Render agent invocation card if message has agent metadata"""
     return rx.cond(
         msg.agent_metadata,
-        # Render agent card with a placeholder block (agent metadata has all info we need)
-        render_agent_invocation_block({}, msg.agent_metadata),
-        rx.box()  # No agent metadata, render nothing
+        # Agent metadata carries everything the card needs
+        render_agent_invocation_block(msg.agent_metadata),
+        _EMPTY_BOX  # No agent metadata, render nothing
     )
 
 
 def render_message_content_blocks(msg) -> rx.Component:
     """Render content blocks for a message"""
-    # Simply render all content blocks normally
-    return rx.vstack(
-        rx.foreach(
-            msg.content_blocks,
-            render_content_block
-        ),
-        spacing="3",
-        width="100%",
-        align_items="start"
+    # All-text messages collapse to a single text node; everything else
+    # renders each block through the type dispatch
+    return rx.cond(
+        msg.is_text_only,
+        rx.text(msg.joined_text, size="2", white_space="pre-wrap"),
+        rx.vstack(
+            rx.foreach(
+                msg.content_blocks,
+                render_content_block
+            ),
+            spacing="3",
+            width="100%",
+            align_items="start"
+        )
     )
 
 
 def render_message_content(msg) -> rx.Component:
     """Render message content - either structured blocks or legacy text"""
-    # Use rx.cond to handle conditional rendering (Reflex doesn't allow if statements on Vars)
-    return rx.cond(
-        msg.content_blocks.length() > 0,
-        # If we have content_blocks, render agent card first (if present) then blocks
-        rx.vstack(
+    # Single switch on the parse-time render_mode instead of nested conds
+    # re-deriving the same facts from content_blocks/content per render
+    return rx.match(
+        msg.render_mode,
+        # Structured content: agent card first (if present) then blocks
+        ("blocks", rx.vstack(
             render_agent_card_if_present(msg),
             render_message_content_blocks(msg),
             spacing="3",
             width="100%",
             align_items="start"
-        ),
-        # Otherwise fall back to plain content or show "(no content)"
-        rx.cond(
-            msg.content,
-            rx.text(msg.content, size="2", white_space="pre-wrap"),
-            rx.text("(no content)", size="2", color="gray", font_style="italic")
-        )
+        )),
+        ("legacy", rx.text(msg.content, size="2", white_space="pre-wrap")),
+        rx.text("(no content)", size="2", color="gray", font_style="italic")
     )
 
 
+# Static placeholder branch, built once at import
+_NO_SESSION_PLACEHOLDER = rx.vstack(
+    rx.heading("No Session Selected", size="6", color="gray"),
+    rx.text(
+        "Select a session from the list to view details",
+        size="3",
+        color="gray"
+    ),
+    spacing="3",
+    align_items="center",
+    justify_content="center",
+    height="400px"
+)
+
+
 def session_detail() -> rx.Component:
     """Render detailed view of selected session"""
     return rx.cond(
@@ -521,18 +561,19 @@ def session_detail() -> rx.Component:
                         ),
                         padding="12px",
                         border_radius="6px",
-                        background_color=COLORS['session_summary_bg'],
-                        border=f"1px solid {COLORS['session_summary_border']}",
+                        background_color=_SESSION_SUMMARY_BG,
+                        border=f"1px solid {_SESSION_SUMMARY_BORDER}",
                         width="100%",
                         margin_top="10px",
                         margin_bottom="10px"
                     ),
-                    rx.box()
+                    _EMPTY_BOX
                 )
             ),
             rx.divider(),
             rx.hstack(
                 rx.heading("Messages", size="4"),
+                rx.cond(State.messages_loading, rx.spinner(size="2"), _EMPTY_BOX),
                 rx.spacer(),
                 rx.button(
                     "Refresh",
@@ -546,16 +587,16 @@ def session_detail() -> rx.Component:
                     "First",
                     on_click=State.first_page,
                     size="2",
-                    disabled=State.current_page == 1
+                    disabled=State.pagination["at_first"]
                 ),
                 rx.button(
                     "Previous",
                     on_click=State.prev_page,
                     size="2",
-                    disabled=State.current_page == 1
+                    disabled=State.pagination["at_first"]
                 ),
                 rx.text(
-                    f"Page {State.current_page} of {State.total_pages}",
+                    State.pagination["label"],
                     size="2",
                     color="gray"
                 ),
@@ -563,13 +604,13 @@ def session_detail() -> rx.Component:
                     "Next",
                     on_click=State.next_page,
                     size="2",
-                    disabled=State.current_page >= State.total_pages
+                    disabled=State.pagination["at_last"]
                 ),
                 rx.button(
                     "Last",
                     on_click=State.last_page,
                     size="2",
-                    disabled=State.current_page >= State.total_pages
+                    disabled=State.pagination["at_last"]
                 ),
                 width="100%",
                 align_items="center"
@@ -582,7 +623,7 @@ def session_detail() -> rx.Component:
                             rx.hstack(
                                 rx.badge(
                                     rx.cond(
-                                        msg.type == "user",
+                                        msg.is_user,
                                         "👤 user",
                                         msg.type
                                     ),
@@ -592,23 +633,30 @@ def session_detail() -> rx.Component:
                             ),
                             render_message_content(msg),
                             rx.cond(
-                                msg.tokens_output > 0,
+                                msg.has_output_tokens,
                                 rx.text(
                                     f"Tokens: {msg.tokens_input} in, {msg.tokens_output} out",
                                     size="1",
                                     color="green"
                                 ),
-                                rx.box()
+                                _EMPTY_BOX
                             ),
                             spacing="2",
                             align_items="start"
                         ),
                         width="100%",
                         background_color=rx.cond(
-                            msg.type == "user",
-                            COLORS['user_message_bg'],
+                            msg.is_user,
+                            _USER_MESSAGE_BG,
                             "white"  # Default white for other messages
-                        )
+                        ),
+                        # Browser-native list virtualization: off-screen cards
+                        # skip layout and paint entirely, and the intrinsic
+                        # size placeholder keeps the scrollbar stable
+                        style={
+                            "content_visibility": "auto",
+                            "contain_intrinsic_size": "auto 160px"
+                        }
                     )
                 ),
                 width="100%",
@@ -621,45 +669,46 @@ def session_detail() -> rx.Component:
             height="100%"
         ),
         # Show placeholder when no session is selected
-        rx.vstack(
-            rx.heading("No Session Selected", size="6", color="gray"),
-            rx.text(
-                "Select a session from the list to view details",
-                size="3",
-                color="gray"
-            ),
-            spacing="3",
-            align_items="center",
-            justify_content="center",
-            height="400px"
-        )
+        _NO_SESSION_PLACEHOLDER
     )
 
 
+@functools.lru_cache(maxsize=16)
 def range_filter_input(label: str, min_filter_name: str, max_filter_name: str) -> rx.Component:
     """Create a range filter input with min/max fields
 
+    Memoized on the (hashable) argument strings: the three sidebar
+    instances are built once per process instead of per sidebar rebuild.
+
     Args:
         label: Display label for the filter (e.g., "Msgs", "In", "Out")
         min_filter_name: State attribute name for minimum value (e.g., "min_messages")
         max_filter_name: State attribute name for maximum value (e.g., "max_messages")
     """
+    # Debounced so typing a value triggers one filter pass when input
+    # settles instead of one full re-filter per keystroke
     return rx.hstack(
         rx.text(label, weight="bold", size="2", min_width="50px"),
-        rx.input(
-            placeholder="Min",
-            type="number",
-            value=getattr(State, min_filter_name),
-            on_change=lambda v: State.set_numeric_filter(min_filter_name, v),
-            width="60px"
+        rx.debounce_input(
+            rx.input(
+                placeholder="Min",
+                type="number",
+                value=getattr(State, min_filter_name),
+                on_change=lambda v: State.set_numeric_filter(min_filter_name, v),
+                width="60px"
+            ),
+            debounce_timeout=200
         ),
         rx.text("to", size="1"),
-        rx.input(
-            placeholder="Max",
-            type="number",
-            value=getattr(State, max_filter_name),
-            on_change=lambda v: State.set_numeric_filter(max_filter_name, v),
-            width="60px"
+        rx.debounce_input(
+            rx.input(
+                placeholder="Max",
+                type="number",
+                value=getattr(State, max_filter_name),
+                on_change=lambda v: State.set_numeric_filter(max_filter_name, v),
+                width="60px"
+            ),
+            debounce_timeout=200
         ),
         spacing="2",
         align_items="center",
@@ -710,11 +759,14 @@ def left_sidebar() -> rx.Component:
                     # Git Branch filter
                     rx.hstack(
                         rx.text("Branch", weight="bold", size="2", min_width="50px"),
-                        rx.input(
-                            placeholder="Filter by branch",
-                            value=State.branch_filter,
-                            on_change=State.set_branch_filter,
-                            flex="1"
+                        rx.debounce_input(
+                            rx.input(
+                                placeholder="Filter by branch",
+                                value=State.branch_filter,
+                                on_change=State.set_branch_filter,
+                                flex="1"
+                            ),
+                            debounce_timeout=200
                         ),
                         spacing="2",
                         align_items="center",
@@ -749,17 +801,17 @@ def left_sidebar() -> rx.Component:
                     border_radius="8px",
                     width="100%"
                 ),
-                rx.box()  # Empty box when collapsed
+                _EMPTY_BOX  # Empty box when collapsed
             ),
             spacing="2",
             width="100%"
         ),
 
-        # Session list
+        # Session list (one page of cards at a time)
         rx.box(
             rx.foreach(
-                State.filtered_sessions,
-                session_card
+                State.paginated_filtered_sessions,
+                lambda session: session_card(session=session)
             ),
             width="100%",
             max_height=rx.cond(
@@ -771,6 +823,33 @@ def left_sidebar() -> rx.Component:
             padding="5px"
         ),
 
+        # Session list pager (hidden when everything fits on one page)
+        rx.cond(
+            State.session_list_pagination["multiple"],
+            rx.hstack(
+                rx.button(
+                    "Prev",
+                    on_click=State.prev_session_list_page,
+                    size="1",
+                    variant="soft",
+                    disabled=State.session_list_pagination["at_first"]
+                ),
+                rx.text(State.session_list_pagination["label"], size="1", color="gray"),
+                rx.button(
+                    "Next",
+                    on_click=State.next_session_list_page,
+                    size="1",
+                    variant="soft",
+                    disabled=State.session_list_pagination["at_last"]
+                ),
+                spacing="2",
+                align_items="center",
+                width="100%",
+                justify="center"
+            ),
+            _EMPTY_BOX
+        ),
+
         spacing="3",
         align_items="start",
         width="400px",
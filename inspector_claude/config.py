@@ -1,5 +1,7 @@
 """Configuration constants for Inspector Claude"""
 
+from dataclasses import dataclass, fields
+
 # Filter default values - single source of truth
 DEFAULT_MIN_MESSAGES = 1
 DEFAULT_MAX_MESSAGES = 10000
@@ -10,17 +12,31 @@ DEFAULT_MAX_INPUT_TOKENS = 1000000
 DEFAULT_MIN_OUTPUT_TOKENS = 0
 DEFAULT_MAX_OUTPUT_TOKENS = 1000000
 
-# Mapping of filter attribute names to their default values
-FILTER_DEFAULTS = {
-    'min_messages': DEFAULT_MIN_MESSAGES,
-    'max_messages': DEFAULT_MAX_MESSAGES,
-    'min_tokens': DEFAULT_MIN_TOKENS,
-    'max_tokens': DEFAULT_MAX_TOKENS,
-    'min_input_tokens': DEFAULT_MIN_INPUT_TOKENS,
-    'max_input_tokens': DEFAULT_MAX_INPUT_TOKENS,
-    'min_output_tokens': DEFAULT_MIN_OUTPUT_TOKENS,
-    'max_output_tokens': DEFAULT_MAX_OUTPUT_TOKENS,
-}
+# Filter attribute names and their default values. A frozen slotted
+# dataclass instead of a dict: reads are C-level slot descriptor accesses,
+# and the field names double as the canonical list of numeric filters.
+@dataclass(frozen=True, slots=True)
+class FilterDefaults:
+    min_messages: int = DEFAULT_MIN_MESSAGES
+    max_messages: int = DEFAULT_MAX_MESSAGES
+    min_tokens: int = DEFAULT_MIN_TOKENS
+    max_tokens: int = DEFAULT_MAX_TOKENS
+    min_input_tokens: int = DEFAULT_MIN_INPUT_TOKENS
+    max_input_tokens: int = DEFAULT_MAX_INPUT_TOKENS
+    min_output_tokens: int = DEFAULT_MIN_OUTPUT_TOKENS
+    max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+
+    def items(self):
+        """Iterate (name, default) pairs, mirroring the old dict API"""
+        for f in fields(self):
+            yield f.name, getattr(self, f.name)
+
+    def get(self, name: str, default=None):
+        """Dict-style lookup for dynamically-named filters"""
+        return getattr(self, name, default)
+
+
+FILTER_DEFAULTS = FilterDefaults()
 
 # Color scheme constants
 COLORS = {
@@ -1,103 +1,238 @@
 """Index and load Claude Code session data from configured claude_dir"""
 
 import json
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
-from pydantic import BaseModel
 import rxconfig
 
+# orjson parses JSONL lines several times faster than stdlib json and
+# accepts raw bytes directly; fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps_indent(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+else:
+    _loads = json.loads
+
+    # Bind one encoder instead of letting json.dumps build a fresh
+    # JSONEncoder per call; skipping ensure_ascii also skips the escape pass
+    _dumps_indent = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+# ciso8601 parses ISO-8601 timestamps in C and takes the 'Z' suffix
+# natively; prefer it when installed, else pick the best stdlib path
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+if ciso8601 is not None:
+    def _parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+        try:
+            return ciso8601.parse_datetime(timestamp_str)
+        except ValueError:
+            return None
+elif sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing 'Z' directly on 3.11+
+    def _parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(timestamp_str)
+        except ValueError:
+            return None
+else:
+    def _parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+        try:
+            return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+# Message types that count toward a session's message_count
+_UA_SET = frozenset(('user', 'assistant'))
+
+# Content block types the UI knows how to render
+_KNOWN_BLOCK_TYPES = frozenset(('text', 'thinking', 'tool_use', 'tool_result', 'file-history-snapshot', 'image'))
+
+# Read buffer for JSONL files; the default 8 KiB means one syscall per
+# handful of lines on multi-MB session files
+_READ_BUFFER_SIZE = 1 << 20
+
+# Files up to this size are slurped in one read and split in memory;
+# larger ones fall back to streaming through the buffered line iterator
+_WHOLE_FILE_READ_LIMIT = 256 << 20
+
+
+def _iter_jsonl(lines) -> Iterator[dict]:
+    """Yield parsed objects from an iterable of JSONL byte lines
+
+    Shared by every loader so line handling — blank-line skip, bytes
+    decode, bad-line tolerance — lives in one place.
+    """
+    for line in lines:
+        # Blank-line check without the allocation str.strip makes;
+        # anything else non-JSON falls into the ValueError handler
+        if len(line) <= 1:
+            continue
+        try:
+            yield _loads(line)
+        except ValueError:
+            continue
+
+
+def _iter_jsonl_path(path) -> Iterator[dict]:
+    """Yield parsed objects from a JSONL file
+
+    Reads the whole file with one syscall and splits in memory, which
+    beats N readline calls for the session files this app sees; files
+    past _WHOLE_FILE_READ_LIMIT stream through a buffered reader instead.
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    if size <= _WHOLE_FILE_READ_LIMIT:
+        with open(path, 'rb') as f:
+            data = f.read()
+        yield from _iter_jsonl(data.split(b'\n'))
+    else:
+        with open(path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+            yield from _iter_jsonl(f)
+
+
 # Constants for session description
 MAX_DESCRIPTION_LENGTH = 100
 TRUNCATION_SUFFIX = "..."
 CONTENT_PREVIEW_LENGTH = 300  # Used for tool result previews
 
 
-def normalize_content_block(block: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalize a content block by converting complex objects to strings for UI display"""
-    normalized = block.copy()
-    block_type = block.get('type')
-
-    # Ensure text blocks have 'text' key
-    if block_type == 'text':
-        if 'text' not in normalized or normalized['text'] is None:
-            normalized['text'] = '(no text content)'
-
-    # Ensure thinking blocks have 'thinking' key
-    if block_type == 'thinking':
-        if 'thinking' not in normalized or normalized['thinking'] is None:
-            normalized['thinking'] = '(no thinking content)'
-
-    # Convert tool_use input to JSON string for display and truncate ID
-    if block_type == 'tool_use':
-        # Ensure required keys exist
-        if 'name' not in normalized:
-            normalized['name'] = 'unknown'
-        if 'input' not in normalized:
-            normalized['input'] = '{}'
-        elif isinstance(normalized['input'], dict):
-            normalized['input'] = json.dumps(normalized['input'], indent=2)
-        # Truncate ID for display
-        if 'id' in normalized:
-            normalized['id_short'] = str(normalized['id'])[:8]
-        else:
-            normalized['id_short'] = 'unknown'
+def _norm_text(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the minimal text block the UI reads"""
+    text = block.get('text')
+    return {
+        'type': 'text',
+        'text': text if text is not None else '(no text content)',
+    }
 
-    # Convert tool_result content to string if it's a list and truncate tool_use_id
-    if block_type == 'tool_result':
-        # Ensure content exists
-        if 'content' not in normalized:
-            normalized['content'] = '(no content)'
-        else:
-            content = normalized['content']
-            if isinstance(content, list):
-                # Tool result content can be a list of text blocks
-                text_parts = []
-                for item in content:
-                    if isinstance(item, dict) and item.get('type') == 'text':
-                        text_parts.append(item.get('text', ''))
-                    else:
-                        text_parts.append(str(item))
-                normalized['content'] = '\n'.join(text_parts)
-            elif isinstance(content, dict):
-                normalized['content'] = json.dumps(content, indent=2)
-
-        # Create a preview version for UI display
-        content_str = str(normalized['content'])
-        if len(content_str) > CONTENT_PREVIEW_LENGTH:
-            normalized['content_preview'] = content_str[:CONTENT_PREVIEW_LENGTH] + TRUNCATION_SUFFIX
-            normalized['is_long'] = True
-        else:
-            normalized['content_preview'] = content_str
-            normalized['is_long'] = False
 
-        # Truncate tool_use_id for display
-        if 'tool_use_id' in normalized:
-            normalized['tool_use_id_short'] = str(normalized['tool_use_id'])[:8]
-        else:
-            normalized['tool_use_id_short'] = 'unknown'
-
-    # Flatten image source structure for easier UI rendering
-    if block_type == 'image':
-        if 'source' in normalized and isinstance(normalized['source'], dict):
-            source = normalized['source']
-            normalized['source_type'] = source.get('type', 'unknown')
-            normalized['source_media_type'] = source.get('media_type', 'image/png')
-            normalized['source_data'] = source.get('data', '')
-            normalized['source_url'] = source.get('url', '')
-        else:
-            # Provide defaults if source is missing
-            normalized['source_type'] = 'unknown'
-            normalized['source_media_type'] = 'image/png'
-            normalized['source_data'] = ''
-            normalized['source_url'] = ''
+def _norm_thinking(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the minimal thinking block the UI reads"""
+    thinking = block.get('thinking')
+    return {
+        'type': 'thinking',
+        'thinking': thinking if thinking is not None else '(no thinking content)',
+    }
 
-    return normalized
+
+def _norm_tool_use(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the minimal tool_use block: input as a JSON string, ID truncated"""
+    input_value = block.get('input', '{}')
+    if isinstance(input_value, dict):
+        input_value = _dumps_indent(input_value)
+    return {
+        'type': 'tool_use',
+        'name': block.get('name', 'unknown'),
+        'input': input_value,
+        'id_short': str(block['id'])[:8] if 'id' in block else 'unknown',
+    }
 
 
-class AgentMetadata(BaseModel):
-    """Metadata about an agent invocation"""
+def _norm_tool_result(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the minimal tool_result block: flattened content plus its preview"""
+    if 'content' not in block:
+        content = '(no content)'
+    else:
+        content = block['content']
+        if isinstance(content, list):
+            # Tool result content can be a list of text blocks; join
+            # straight from a generator, with an exact type check since
+            # decoded JSON can only contain dict itself
+            content = '\n'.join(
+                item.get('text', '') if type(item) is dict and item.get('type') == 'text' else str(item)
+                for item in content
+            )
+        elif isinstance(content, dict):
+            content = _dumps_indent(content)
+
+    # Create a preview version for UI display; content is already a str
+    # in the common case, so don't pay for a copy re-stringifying it
+    if type(content) is not str:
+        content = str(content)
+    if len(content) > CONTENT_PREVIEW_LENGTH:
+        content_preview = content[:CONTENT_PREVIEW_LENGTH] + TRUNCATION_SUFFIX
+        is_long = True
+    else:
+        content_preview = content
+        is_long = False
+
+    # Only the short form is kept: the UI displays it, and expansion
+    # state is keyed on the dense tool_result_idx stamped after loading
+    tool_use_id = block.get('tool_use_id', '')
+    return {
+        'type': 'tool_result',
+        'content': content,
+        'content_preview': content_preview,
+        'is_long': is_long,
+        'tool_use_id_short': str(tool_use_id)[:8] if tool_use_id else 'unknown',
+    }
+
+
+def _norm_image(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the minimal image block with its source structure flattened"""
+    source = block.get('source')
+    if not isinstance(source, dict):
+        source = {}
+    return {
+        'type': 'image',
+        'source_type': source.get('type', 'unknown'),
+        'source_media_type': source.get('media_type', 'image/png'),
+        'source_data': source.get('data', ''),
+        'source_url': source.get('url', ''),
+    }
+
+
+# Per-type normalizers, dispatched by block type. A dict lookup replaces
+# the old if-chain that tested every type for every block
+_NORMALIZERS = {
+    'text': _norm_text,
+    'thinking': _norm_thinking,
+    'tool_use': _norm_tool_use,
+    'tool_result': _norm_tool_result,
+    'image': _norm_image,
+}
+
+
+def normalize_content_block(block: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a content block into the minimal dict the UI reads
+
+    Each normalizer builds a fresh dict with just the display keys instead
+    of copying the raw block, so large payloads the UI never touches (raw
+    image source dicts, unrecognized fields) aren't duplicated. Unknown
+    types (file-history-snapshot) still pass through as a copy.
+    """
+    normalizer = _NORMALIZERS.get(block.get('type'))
+    if normalizer is not None:
+        return normalizer(block)
+    return block.copy()
+
+
+@dataclass(slots=True)
+class AgentMetadata:
+    """Metadata about an agent invocation
+
+    A plain slotted dataclass: these come from trusted local JSONL, so
+    pydantic's per-construction validation was pure overhead on the
+    per-message parse path.
+    """
     agent_id: str
     tool_use_id: str          # Links to the tool_use that created this agent
     prompt: str               # Task given to agent
@@ -107,7 +242,7 @@ class AgentMetadata(BaseModel):
     summary: str              # Summary from agent's final response (truncated)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMessage:
     """Represents a single message in a conversation"""
     uuid: str
@@ -120,6 +255,18 @@ class SessionMessage:
     tokens_input: int = 0
     tokens_output: int = 0
     agent_metadata: Optional[AgentMetadata] = None  # For tool_result blocks that invoked agents
+    # Render flags precomputed at parse time so the UI branches on plain
+    # booleans instead of re-deriving them as reactive expressions
+    is_user: bool = False
+    has_output_tokens: bool = False
+    has_blocks: bool = False
+    # How the UI should render this message: "blocks" (structured content
+    # blocks), "legacy" (plain text content), or "empty"
+    render_mode: str = "empty"
+    # Fast path for messages whose blocks are all plain text: the UI can
+    # render joined_text as one node instead of a foreach over blocks
+    is_text_only: bool = False
+    joined_text: str = ""
 
 
 @dataclass
@@ -135,26 +282,68 @@ class Session:
     end_time: Optional[datetime] = None
     is_agent: bool = False  # True if this is an agent side-chain
     parent_session_id: Optional[str] = None  # For agents, links to parent session ID
+    # True once full message content has been loaded (not just metadata);
+    # lets the cache tell a demoted-but-complete session from a metadata stub
+    messages_loaded: bool = field(default=False, repr=False, compare=False)
+    # Cached message count so repeated reads (filters, stats) don't rescan
+    # the message list; reset to None when messages are replaced
+    _message_count: Optional[int] = field(default=None, repr=False, compare=False)
+    # Raw min/max timestamp strings seen while parsing; ISO-8601 strings in
+    # one file share a format, so string order is chronological order and
+    # the loaders parse just these two instead of one datetime per line
+    _first_timestamp_str: Optional[str] = field(default=None, repr=False, compare=False)
+    _last_timestamp_str: Optional[str] = field(default=None, repr=False, compare=False)
+    # Cached (input, output) token totals, filled by one pass over the
+    # message list; the three total_* properties previously each re-walked it
+    _token_totals: Optional[tuple] = field(default=None, repr=False, compare=False)
+    # Cached description; every session card render asks for it
+    _description: Optional[str] = field(default=None, repr=False, compare=False)
+
+    def invalidate_message_caches(self) -> None:
+        """Drop derived per-message caches after messages are replaced"""
+        self._message_count = None
+        self._token_totals = None
+        self._description = None
+
+    def _totals(self) -> tuple:
+        if self._token_totals is None:
+            tokens_in = 0
+            tokens_out = 0
+            for m in self.messages:
+                tokens_in += m.tokens_input
+                tokens_out += m.tokens_output
+            self._token_totals = (tokens_in, tokens_out)
+        return self._token_totals
+
+    def finalize_time_range(self) -> None:
+        """Parse the tracked min/max timestamp strings into start/end times"""
+        if self._first_timestamp_str is not None:
+            self.start_time = _parse_timestamp(self._first_timestamp_str)
+        if self._last_timestamp_str is not None:
+            self.end_time = _parse_timestamp(self._last_timestamp_str)
 
     @property
     def message_count(self) -> int:
         """Return count of user/assistant messages (not system messages)"""
-        return len([m for m in self.messages if m.type in ('user', 'assistant')])
+        if self._message_count is None:
+            self._message_count = len([m for m in self.messages if m.type in _UA_SET])
+        return self._message_count
 
     @property
     def total_tokens(self) -> int:
         """Return total token usage across all messages"""
-        return sum(m.tokens_input + m.tokens_output for m in self.messages)
+        totals = self._totals()
+        return totals[0] + totals[1]
 
     @property
     def total_input_tokens(self) -> int:
         """Return total input tokens across all messages"""
-        return sum(m.tokens_input for m in self.messages)
+        return self._totals()[0]
 
     @property
     def total_output_tokens(self) -> int:
         """Return total output tokens across all messages"""
-        return sum(m.tokens_output for m in self.messages)
+        return self._totals()[1]
 
     @property
     def duration_minutes(self) -> Optional[float]:
@@ -170,15 +359,17 @@ class Session:
         if self.summary:
             return self.summary
 
-        # Fall back to first user message
+        if self._description is None:
+            self._description = self._compute_description()
+        return self._description
+
+    def _compute_description(self) -> str:
+        """Derive a description from the first user message"""
         for msg in self.messages:
             if msg.type == 'user' and msg.content:
-                # Get first line or first MAX_DESCRIPTION_LENGTH chars, whichever is shorter
-                content = msg.content.strip()
-                if '\n' in content:
-                    first_line = content.split('\n')[0].strip()
-                else:
-                    first_line = content
+                # First line only; partition stops at the first newline
+                # instead of splitting the whole content into a list
+                first_line = msg.content.strip().partition('\n')[0].strip()
 
                 # Truncate if too long
                 if len(first_line) > MAX_DESCRIPTION_LENGTH:
@@ -237,23 +428,51 @@ def extract_agent_metadata(message_data: dict) -> Optional[AgentMetadata]:
     )
 
 
-def parse_message_from_jsonl(data: dict, load_content: bool = True, load_blocks: bool = True) -> Optional[SessionMessage]:
+def parse_message_from_jsonl(data: dict, load_content: bool = True, load_blocks: bool = True,
+                             description_only: bool = False) -> Optional[SessionMessage]:
     """Parse a single JSONL line into a SessionMessage
 
     Args:
         data: Parsed JSON object from JSONL line
         load_content: Whether to load full message content
         load_blocks: Whether to populate content_blocks (only applies if load_content=True)
+        description_only: With load_content, stop after the first text block —
+            enough for Session.description, which only reads the first line
 
     Returns:
         SessionMessage or None if this is a non-message entry (e.g., summary)
     """
-    msg_type = data.get('type', '')
+    # Interning collapses the handful of repeated type values ('user',
+    # 'assistant', ...) parsed fresh from every line into shared objects,
+    # making the equality checks below pointer comparisons
+    msg_type = sys.intern(data.get('type', ''))
 
     # Skip summary entries
     if msg_type == 'summary':
         return None
 
+    message_data = data.get('message')
+
+    # Metadata-only fast path: non-user lines contribute nothing beyond
+    # identity and token usage, so skip content handling entirely
+    if not load_content and msg_type != 'user':
+        msg = SessionMessage(
+            uuid=data.get('uuid', ''),
+            type=msg_type,
+            timestamp=data.get('timestamp', '')
+        )
+        if message_data is not None:
+            role = message_data.get('role')
+            msg.role = sys.intern(role) if role else None
+            model = message_data.get('model')
+            msg.model = sys.intern(model) if model else None
+            usage = message_data.get('usage')
+            if usage:
+                msg.tokens_input = usage.get('input_tokens', 0)
+                msg.tokens_output = usage.get('output_tokens', 0)
+        msg.has_output_tokens = msg.tokens_output > 0
+        return msg
+
     msg = SessionMessage(
         uuid=data.get('uuid', ''),
         type=msg_type,
@@ -267,33 +486,63 @@ def parse_message_from_jsonl(data: dict, load_content: bool = True, load_blocks:
             msg.agent_metadata = agent_metadata
 
     # Extract content and usage from message
-    if 'message' in data:
-        message_data = data['message']
-        msg.role = message_data.get('role')
+    if message_data is not None:
+        # Like the type field, role and model repeat a handful of values
+        # across every line; interning shares one str per distinct value
+        role = message_data.get('role')
+        msg.role = sys.intern(role) if role else None
 
         if load_content:
             content = message_data.get('content')
             if isinstance(content, str):
                 msg.content = content
             elif isinstance(content, list):
-                text_parts = []
-                for block in content:
-                    if isinstance(block, dict):
-                        block_type = block.get('type')
-                        if block_type in ('text', 'thinking', 'tool_use', 'tool_result', 'file-history-snapshot', 'image'):
-                            if load_blocks:
-                                msg.content_blocks.append(normalize_content_block(block))
-                        if block_type == 'text':
-                            text_parts.append(block.get('text', ''))
-                msg.content = '\n'.join(text_parts) if text_parts else None
-
-        msg.model = message_data.get('model')
+                if description_only:
+                    # First text block is all the description reads
+                    for block in content:
+                        if isinstance(block, dict) and block.get('type') == 'text':
+                            msg.content = block.get('text', '')
+                            break
+                else:
+                    text_parts = []
+                    for block in content:
+                        if isinstance(block, dict):
+                            block_type = block.get('type')
+                            if block_type in _KNOWN_BLOCK_TYPES:
+                                if load_blocks:
+                                    # Normalization stays eager: Reflex
+                                    # serializes the whole message to the
+                                    # client as plain dicts, so a lazy
+                                    # sequence view would be forced to
+                                    # normalize everything at delta time
+                                    # anyway
+                                    normalized = normalize_content_block(block)
+                                    # Position within the message, so consumers
+                                    # that regroup blocks can restore order
+                                    normalized['order_index'] = len(msg.content_blocks)
+                                    msg.content_blocks.append(normalized)
+                            if block_type == 'text':
+                                text_parts.append(block.get('text', ''))
+                    msg.content = '\n'.join(text_parts) if text_parts else None
+
+        model = message_data.get('model')
+        msg.model = sys.intern(model) if model else None
 
         # Extract token usage
         usage = message_data.get('usage', {})
         msg.tokens_input = usage.get('input_tokens', 0)
         msg.tokens_output = usage.get('output_tokens', 0)
 
+    msg.is_user = msg_type == 'user'
+    msg.has_output_tokens = msg.tokens_output > 0
+    msg.has_blocks = bool(msg.content_blocks)
+    if msg.has_blocks:
+        msg.render_mode = 'blocks'
+        if all(b.get('type') == 'text' for b in msg.content_blocks):
+            msg.is_text_only = True
+            msg.joined_text = '\n\n'.join(b['text'] for b in msg.content_blocks)
+    elif msg.content:
+        msg.render_mode = 'legacy'
     return msg
 
 
@@ -304,24 +553,21 @@ def parse_session_metadata_from_jsonl(data: dict, session: Session) -> None:
         data: Parsed JSON object from JSONL line
         session: Session object to update
     """
-    msg_type = data.get('type', '')
+    msg_type = sys.intern(data.get('type', ''))
 
     # Extract summary
     if msg_type == 'summary' and session.summary is None:
         session.summary = data.get('summary', '')
         return
 
-    # Parse timestamp and update session time range
+    # Track the time range as raw strings; Session.finalize_time_range
+    # parses only the two extremes once the file has been consumed
     timestamp_str = data.get('timestamp', '')
     if timestamp_str:
-        try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            if session.start_time is None or timestamp < session.start_time:
-                session.start_time = timestamp
-            if session.end_time is None or timestamp > session.end_time:
-                session.end_time = timestamp
-        except:
-            pass
+        if session._first_timestamp_str is None or timestamp_str < session._first_timestamp_str:
+            session._first_timestamp_str = timestamp_str
+        if session._last_timestamp_str is None or timestamp_str > session._last_timestamp_str:
+            session._last_timestamp_str = timestamp_str
 
     # Extract git branch
     if session.git_branch is None:
@@ -332,6 +578,22 @@ def parse_session_metadata_from_jsonl(data: dict, session: Session) -> None:
         session.project_path = data['cwd']
 
 
+def _assign_tool_result_indices(messages: List[SessionMessage]) -> None:
+    """Stamp a dense per-session index on every tool_result block
+
+    The UI keys expansion state on these small integers instead of full
+    tool_use_id UUID strings, keeping the expanded-results set cheap to
+    serialize and compare.
+    """
+    idx = 0
+    for msg in messages:
+        if msg.content_blocks:
+            for block in msg.content_blocks:
+                if block.get('type') == 'tool_result':
+                    block['tool_result_idx'] = idx
+                    idx += 1
+
+
 def load_agent_session(agent_id: str, project_dir: str, claude_dir: Path = None) -> Optional[Session]:
     """Load a specific agent session file
 
@@ -360,40 +622,181 @@ def load_agent_session(agent_id: str, project_dir: str, claude_dir: Path = None)
         is_agent=True
     )
 
+    msg_count = 0
+    tokens_in = 0
+    tokens_out = 0
+
+    try:
+        for data in _iter_jsonl_path(agent_file):
+            # Extract parent session ID from first message
+            if session.parent_session_id is None:
+                session.parent_session_id = data.get('sessionId')
+
+            # Update session metadata
+            parse_session_metadata_from_jsonl(data, session)
+
+            # Parse message (with full content)
+            msg = parse_message_from_jsonl(data, load_content=True)
+            if msg:
+                session.messages.append(msg)
+                if msg.type in _UA_SET:
+                    msg_count += 1
+                tokens_in += msg.tokens_input
+                tokens_out += msg.tokens_output
+
+    except Exception as e:
+        print(f"Error loading agent session {agent_id}: {e}")
+        return None
+
+    session._message_count = msg_count
+    session._token_totals = (tokens_in, tokens_out)
+    session.finalize_time_range()
+    _assign_tool_result_indices(session.messages)
+    session.messages_loaded = True
+    return session
+
+
+# Minimum number of session files before load_sessions fans parsing out
+# to a process pool; below this the fork/pickle overhead dominates
+PARALLEL_LOAD_THRESHOLD = 32
+
+# Filename of the on-disk metadata index, stored inside claude_dir
+INDEX_FILENAME = ".inspector_index.pkl"
+
+# Bump when the Session/SessionMessage layout changes so stale indexes
+# from older builds are discarded instead of deserialized into new code
+INDEX_VERSION = 1
+
+
+def _load_index(claude_dir: Path) -> Dict[str, tuple]:
+    """Load the on-disk metadata index
+
+    Maps session_id to (mtime_ns, size, Session). A missing, unreadable
+    or version-mismatched index is treated as empty — it's purely a
+    parse cache.
+    """
+    try:
+        with open(claude_dir / INDEX_FILENAME, 'rb') as f:
+            payload = pickle.load(f)
+        if isinstance(payload, dict) and payload.get('version') == INDEX_VERSION:
+            return payload['entries']
+    except Exception:
+        pass
+    return {}
+
+
+def _save_index(claude_dir: Path, index: Dict[str, tuple]) -> None:
+    """Persist the metadata index; failures are non-fatal
+
+    Writes to a sibling temp file and swaps it in with os.replace so a
+    crash mid-write can't leave a truncated index behind.
+    """
+    index_path = claude_dir / INDEX_FILENAME
+    tmp_path = index_path.with_suffix('.pkl.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': INDEX_VERSION, 'entries': index}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, index_path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _read_session_file(args: tuple) -> tuple:
+    """Read one session file's raw bytes for _parse_session_file
+
+    Runs on a thread pool so reads overlap with parsing; returns
+    (args, data) with data None when the read fails, in which case the
+    parser falls back to opening the file itself and reporting the error.
+    """
     try:
-        with open(agent_file, 'r') as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        with open(args[1], 'rb') as f:
+            return args, f.read()
+    except OSError:
+        return args, None
 
-                try:
-                    data = json.loads(line)
 
-                    # Extract parent session ID from first message
-                    if session.parent_session_id is None:
-                        session.parent_session_id = data.get('sessionId')
+def _parse_session_file(args: tuple, data: Optional[bytes] = None) -> Optional[tuple]:
+    """Parse one session file into (session_id, Session)
 
-                    # Update session metadata
-                    parse_session_metadata_from_jsonl(data, session)
+    Top-level (not nested) so ProcessPoolExecutor can pickle it. Takes a
+    single (project_dir_name, session_file, load_messages) tuple for the
+    same reason. When data holds pre-read file bytes the parser consumes
+    those instead of touching the filesystem.
 
-                    # Parse message (with full content)
-                    msg = parse_message_from_jsonl(data, load_content=True)
-                    if msg:
-                        session.messages.append(msg)
+    Returns:
+        (session_id, Session), or None if the file couldn't be read
+    """
+    project_dir_name, session_path, load_messages = args
+    # session_path is a plain str; basename minus the ".jsonl" suffix
+    session_id = os.path.basename(session_path)[:-6]
+    session = Session(
+        session_id=session_id,
+        project_path="",  # Will be populated from cwd field in session data
+        project_dir=project_dir_name  # Store encoded directory name for file lookups
+    )
+
+    # Track if we've loaded the first user message content
+    first_user_message_loaded = False
 
-                except json.JSONDecodeError:
-                    continue
+    # Accumulate counts and token totals during the parse so the Session
+    # properties never have to re-walk the message list
+    msg_count = 0
+    tokens_in = 0
+    tokens_out = 0
+
+    try:
+        if data is not None:
+            lines = _iter_jsonl(data.split(b'\n'))
+        else:
+            lines = _iter_jsonl_path(session_path)
+        for parsed_line in lines:
+            # Update session metadata
+            parse_session_metadata_from_jsonl(parsed_line, session)
+
+            # Determine content loading strategy
+            msg_type = parsed_line.get('type', '')
+            should_load_content = load_messages or (msg_type == 'user' and not first_user_message_loaded)
+            should_load_blocks = load_messages  # Only load blocks if loading all messages
+
+            # Parse message
+            msg = parse_message_from_jsonl(parsed_line, load_content=should_load_content, load_blocks=should_load_blocks,
+                                           description_only=not load_messages)
+            if msg:
+                session.messages.append(msg)
+                if msg_type in _UA_SET:
+                    msg_count += 1
+                tokens_in += msg.tokens_input
+                tokens_out += msg.tokens_output
+
+                # Track first user message for description
+                if msg_type == 'user' and msg.content:
+                    first_user_message_loaded = True
+
+        session._message_count = msg_count
+        session._token_totals = (tokens_in, tokens_out)
+        session.finalize_time_range()
+        if load_messages:
+            _assign_tool_result_indices(session.messages)
+        session.messages_loaded = load_messages
+        return session_id, session
 
     except Exception as e:
-        print(f"Error loading agent session {agent_id}: {e}")
+        print(f"Error loading session {session_id}: {e}")
         return None
 
-    return session
-
 
 def load_sessions(claude_dir: Path = None, load_messages: bool = False) -> Dict[str, Session]:
     """Load all sessions from configured claude_dir
 
+    Session files are independent, so large trees are parsed across a
+    process pool; small trees stay sequential to avoid pool startup cost.
+    Metadata-only loads also consult an on-disk index keyed by each file's
+    (mtime_ns, size), so unchanged files skip the JSONL parse entirely.
+
     Args:
         claude_dir: Path to .claude directory (defaults to rxconfig.claude_dir)
         load_messages: If True, load full message content. If False, only load metadata.
@@ -406,60 +809,75 @@ def load_sessions(claude_dir: Path = None, load_messages: bool = False) -> Dict[
     if not projects_dir.exists():
         return sessions
 
-    # Iterate through project directories
-    for project_dir in projects_dir.iterdir():
-        if not project_dir.is_dir():
-            continue
-
-        # Load each session file
-        for session_file in project_dir.glob("*.jsonl"):
-            if session_file.name.startswith("agent-"):
-                continue  # Skip agent sub-sessions for now
-
-            session_id = session_file.stem
-            session = Session(
-                session_id=session_id,
-                project_path="",  # Will be populated from cwd field in session data
-                project_dir=project_dir.name  # Store encoded directory name for file lookups
-            )
-
-            # Track if we've loaded the first user message content
-            first_user_message_loaded = False
-
-            try:
-                with open(session_file, 'r') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
+    # The index only caches metadata-mode parses; full loads bypass it
+    index = _load_index(claude_dir) if not load_messages else {}
+    stats = {}
+
+    # Collect the work list up front, satisfying what we can from the index.
+    # os.scandir hands back DirEntry objects whose type and stat info come
+    # from the directory read itself, avoiding a stat() per path
+    work = []
+    with os.scandir(projects_dir) as project_entries:
+        for project_entry in project_entries:
+            if not project_entry.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(project_entry.path) as file_entries:
+                for file_entry in file_entries:
+                    name = file_entry.name
+                    if not name.endswith('.jsonl') or name.startswith('agent-'):
+                        continue  # Skip agent sub-sessions for now
 
+                    if not load_messages:
                         try:
-                            data = json.loads(line)
-
-                            # Update session metadata
-                            parse_session_metadata_from_jsonl(data, session)
-
-                            # Determine content loading strategy
-                            msg_type = data.get('type', '')
-                            should_load_content = load_messages or (msg_type == 'user' and not first_user_message_loaded)
-                            should_load_blocks = load_messages  # Only load blocks if loading all messages
-
-                            # Parse message
-                            msg = parse_message_from_jsonl(data, load_content=should_load_content, load_blocks=should_load_blocks)
-                            if msg:
-                                session.messages.append(msg)
-
-                                # Track first user message for description
-                                if msg_type == 'user' and msg.content:
-                                    first_user_message_loaded = True
-
-                        except json.JSONDecodeError:
+                            st = file_entry.stat()
+                        except OSError:
                             continue
-
-                sessions[session_id] = session
-
-            except Exception as e:
-                print(f"Error loading session {session_id}: {e}")
-                continue
+                        session_id = name[:-6]
+                        cached = index.get(session_id)
+                        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                            sessions[session_id] = cached[2]
+                            continue
+                        stats[session_id] = (st.st_mtime_ns, st.st_size)
+
+                    work.append((project_entry.name, file_entry.path, load_messages))
+
+    parsed = {}
+    if len(work) >= PARALLEL_LOAD_THRESHOLD:
+        max_workers = max(1, (os.cpu_count() or 2) - 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_parse_session_file, work, chunksize=8)
+            for result in results:
+                if result is not None:
+                    parsed[result[0]] = result[1]
+    elif len(work) > 1:
+        # Below the process-pool threshold, still overlap I/O with parsing:
+        # a thread pool prefetches raw bytes while this thread parses
+        with ThreadPoolExecutor(max_workers=min(32, len(work))) as executor:
+            for args, data in executor.map(_read_session_file, work):
+                result = _parse_session_file(args, data)
+                if result is not None:
+                    parsed[result[0]] = result[1]
+    else:
+        for args in work:
+            result = _parse_session_file(args)
+            if result is not None:
+                parsed[result[0]] = result[1]
+
+    sessions.update(parsed)
+
+    # Fold freshly parsed metadata back into the index, and prune entries
+    # for session files no longer on disk so the pickle doesn't grow
+    # monotonically with every session ever seen
+    if not load_messages:
+        stale = index.keys() - sessions.keys()
+        for session_id in stale:
+            del index[session_id]
+        for session_id, session in parsed.items():
+            if session_id in stats:
+                mtime_ns, size = stats[session_id]
+                index[session_id] = (mtime_ns, size, session)
+        if parsed or stale:
+            _save_index(claude_dir, index)
 
     return sessions
 
@@ -486,26 +904,73 @@ def load_session_messages(session_id: str, project_dir: str, claude_dir: Path =
         return messages
 
     try:
-        with open(session_file, 'r') as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        for data in _iter_jsonl_path(session_file):
+            # Parse message with full content and blocks
+            msg = parse_message_from_jsonl(data, load_content=True, load_blocks=True)
+            if msg:
+                messages.append(msg)
+
+    except Exception as e:
+        print(f"Error loading messages for session {session_id}: {e}")
+
+    _assign_tool_result_indices(messages)
+    return messages
 
-                try:
-                    data = json.loads(line)
 
-                    # Parse message with full content and blocks
-                    msg = parse_message_from_jsonl(data, load_content=True, load_blocks=True)
-                    if msg:
-                        messages.append(msg)
+def load_session_messages_lite(session_id: str, project_dir: str, claude_dir: Path = None,
+                               head_kb: int = 64, tail_kb: int = 64) -> tuple:
+    """Load a head/tail sample of a session's messages for fast first paint
 
-                except json.JSONDecodeError:
-                    continue
+    Reads only the first head_kb and last tail_kb of the file and parses
+    the complete lines inside those windows, so huge sessions can show
+    their opening and latest messages immediately while a full parse
+    happens elsewhere. Small files are simply loaded in full.
 
+    Args:
+        session_id: The session ID
+        project_dir: The encoded project directory name
+        claude_dir: Path to .claude directory (defaults to rxconfig.claude_dir)
+        head_kb: Size of the head window in KiB
+        tail_kb: Size of the tail window in KiB
+
+    Returns:
+        (messages, complete) where complete is True when the sample covers
+        the whole file and the list needs no follow-up full load
+    """
+    if claude_dir is None:
+        claude_dir = rxconfig.claude_dir
+
+    session_file = claude_dir / "projects" / project_dir / f"{session_id}.jsonl"
+    try:
+        size = os.path.getsize(session_file)
+    except OSError:
+        return [], False
+
+    if size <= (head_kb + tail_kb) * 1024:
+        return load_session_messages(session_id, project_dir, claude_dir), True
+
+    messages = []
+    try:
+        with open(session_file, 'rb') as f:
+            head = f.read(head_kb * 1024)
+            f.seek(-tail_kb * 1024, os.SEEK_END)
+            tail = f.read()
+
+        # Drop the partial line at each window boundary: the head's last
+        # fragment and the tail's first
+        lines = head.split(b'\n')[:-1] + tail.split(b'\n')[1:]
+        for data in _iter_jsonl(lines):
+            msg = parse_message_from_jsonl(data, load_content=True, load_blocks=True)
+            if msg:
+                messages.append(msg)
     except Exception as e:
-        print(f"Error loading messages for session {session_id}: {e}")
+        print(f"Error lite-loading session {session_id}: {e}")
+        return [], False
 
-    return messages
+    # Indices are dense within the sample; the follow-up full load
+    # restamps them over the complete message list
+    _assign_tool_result_indices(messages)
+    return messages, False
 
 
 def get_session_summary(session: Session) -> Dict:
@@ -1,10 +1,11 @@
 """Application state management for Inspector Claude"""
 
+import asyncio
+
 import reflex as rx
 from typing import List, Dict, Optional, Set
-from datetime import datetime
 from pathlib import Path
-from inspector_claude.indexer import load_sessions, load_session_messages, load_agent_session, Session, SessionMessage
+from inspector_claude.indexer import load_sessions, load_session_messages, load_session_messages_lite, Session, SessionMessage
 from inspector_claude.config import FILTER_DEFAULTS
 import inspector_claude.cache as cache
 import rxconfig
@@ -21,6 +22,16 @@ class SessionSummary(rx.Base):
     input_tokens: int
     output_tokens: int
     start_time: str
+    # Display strings formatted once at construction so session_card does
+    # no per-render f-string work (the sidebar renders hundreds of cards)
+    id_display: str = ""
+    project_display: str = ""
+    branch_display: str = ""
+    message_count_label: str = ""
+    total_tokens_label: str = ""
+    input_tokens_label: str = ""
+    output_tokens_label: str = ""
+    start_time_label: str = ""
 
 
 class State(rx.State):
@@ -33,14 +44,14 @@ class State(rx.State):
     filtered_sessions: List[SessionSummary] = []
 
     # Filter values
-    min_messages: int = FILTER_DEFAULTS['min_messages']
-    max_messages: int = FILTER_DEFAULTS['max_messages']
-    min_tokens: int = FILTER_DEFAULTS['min_tokens']
-    max_tokens: int = FILTER_DEFAULTS['max_tokens']
-    min_input_tokens: int = FILTER_DEFAULTS['min_input_tokens']
-    max_input_tokens: int = FILTER_DEFAULTS['max_input_tokens']
-    min_output_tokens: int = FILTER_DEFAULTS['min_output_tokens']
-    max_output_tokens: int = FILTER_DEFAULTS['max_output_tokens']
+    min_messages: int = FILTER_DEFAULTS.min_messages
+    max_messages: int = FILTER_DEFAULTS.max_messages
+    min_tokens: int = FILTER_DEFAULTS.min_tokens
+    max_tokens: int = FILTER_DEFAULTS.max_tokens
+    min_input_tokens: int = FILTER_DEFAULTS.min_input_tokens
+    max_input_tokens: int = FILTER_DEFAULTS.max_input_tokens
+    min_output_tokens: int = FILTER_DEFAULTS.min_output_tokens
+    max_output_tokens: int = FILTER_DEFAULTS.max_output_tokens
     branch_filter: str = ""
     start_date_filter: str = ""  # ISO date string (YYYY-MM-DD)
     end_date_filter: str = ""    # ISO date string (YYYY-MM-DD)
@@ -52,22 +63,49 @@ class State(rx.State):
     current_page: int = 1
     page_size: int = 20
 
+    # Sidebar session-list pagination; only one page of cards is in the
+    # DOM at a time, so thousand-session archives don't bloat the sidebar
+    session_list_page: int = 1
+    session_list_page_size: int = 50
+
     # Filter panel state
     filters_expanded: bool = False
 
-    # Tool result expansion state (tracks which tool results are expanded by tool_use_id)
-    expanded_tool_results: Set[str] = set()
+    # Tool result expansion state (tracks which tool results are expanded
+    # by their dense per-session tool_result_idx)
+    expanded_tool_results: Set[int] = set()
 
     # Agent navigation state
     viewing_agent_id: Optional[str] = None  # None = main session, else agent ID
     parent_page_number: int = 1  # Save parent's page number when viewing agent
 
-    def toggle_tool_result_expansion(self, tool_use_id: str):
-        """Toggle expansion of a tool result"""
-        if tool_use_id in self.expanded_tool_results:
-            self.expanded_tool_results.discard(tool_use_id)
+    # True while the selected session's messages load in the background
+    messages_loading: bool = False
+
+    # Bumped whenever a session's messages change behind the module-level
+    # cache (background loads, refreshes). The message vars read it so
+    # Reflex recomputes them: they otherwise depend only on the selection
+    # and page vars, since the cache itself is invisible to dep tracking
+    messages_version: int = 0
+
+    # Signature of the filter values the current filtered_sessions was
+    # built from; lets apply_filters skip identical re-submissions
+    # (backend-only var, never serialized to the frontend)
+    _last_filter_sig: Optional[tuple] = None
+
+    # Prebuilt per-session display summaries and filter metadata, rebuilt
+    # only when all_sessions changes; apply_filters just selects from
+    # these instead of re-deriving summaries per keystroke
+    # (backend-only vars, never serialized to the frontend)
+    _summary_cache: Dict[str, SessionSummary] = {}
+    _filter_meta: Dict[str, tuple] = {}
+
+    def toggle_tool_result_expansion(self, result_idx: int):
+        """Toggle expansion of a tool result by its per-session index"""
+        if result_idx in self.expanded_tool_results:
+            self.expanded_tool_results.discard(result_idx)
         else:
-            self.expanded_tool_results.add(tool_use_id)
+            self.expanded_tool_results.add(result_idx)
 
     def toggle_filters(self):
         """Toggle filter panel visibility"""
@@ -75,7 +113,7 @@ class State(rx.State):
 
     def reset_filters(self):
         """Reset all filters to their default values"""
-        # Reset numeric filters using FILTER_DEFAULTS dictionary
+        # Reset numeric filters from the FILTER_DEFAULTS fields
         for attr_name, default_value in FILTER_DEFAULTS.items():
             setattr(self, attr_name, default_value)
         # Reset string filters
@@ -84,23 +122,27 @@ class State(rx.State):
         self.end_date_filter = ""
         self.apply_filters()
 
-    @rx.var
+    @rx.var(cache=True)
     def active_filter_count(self) -> int:
         """Count how many filters are currently active (different from defaults)"""
         count = 0
 
-        # Check range filter pairs (each pair counts as 1 filter if either value differs from default)
-        filter_pairs = [
-            ('min_messages', 'max_messages'),
-            ('min_tokens', 'max_tokens'),
-            ('min_input_tokens', 'max_input_tokens'),
-            ('min_output_tokens', 'max_output_tokens'),
-        ]
-
-        for min_name, max_name in filter_pairs:
-            if (getattr(self, min_name) != FILTER_DEFAULTS[min_name] or
-                getattr(self, max_name) != FILTER_DEFAULTS[max_name]):
-                count += 1
+        # Each range pair counts as 1 filter if either value differs from its
+        # default. Unrolled into direct attribute reads: Reflex's dependency
+        # tracking can't see through getattr, so a loop over name strings
+        # would leave the cached var stale when a numeric filter changes.
+        if (self.min_messages != FILTER_DEFAULTS.min_messages or
+                self.max_messages != FILTER_DEFAULTS.max_messages):
+            count += 1
+        if (self.min_tokens != FILTER_DEFAULTS.min_tokens or
+                self.max_tokens != FILTER_DEFAULTS.max_tokens):
+            count += 1
+        if (self.min_input_tokens != FILTER_DEFAULTS.min_input_tokens or
+                self.max_input_tokens != FILTER_DEFAULTS.max_input_tokens):
+            count += 1
+        if (self.min_output_tokens != FILTER_DEFAULTS.min_output_tokens or
+                self.max_output_tokens != FILTER_DEFAULTS.max_output_tokens):
+            count += 1
 
         # Branch filter
         if self.branch_filter:
@@ -112,6 +154,53 @@ class State(rx.State):
 
         return count
 
+    def _rebuild_summary_cache(self):
+        """Rebuild the prebuilt summaries and filter metadata from all_sessions"""
+        summaries = {}
+        filter_meta = {}
+        for session_id, session in self.all_sessions.items():
+            branch = session.git_branch or "unknown"
+            start_time = session.start_time.isoformat() if session.start_time else "N/A"
+            message_count = session.message_count
+            total_tokens = session.total_tokens
+            input_tokens = session.total_input_tokens
+            output_tokens = session.total_output_tokens
+            summaries[session_id] = SessionSummary(
+                session_id=session_id,
+                description=session.description,
+                project_path=session.project_path,
+                git_branch=branch,
+                message_count=message_count,
+                total_tokens=total_tokens,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                start_time=start_time,
+                id_display=f"ID: {session_id}",
+                project_display=f"Project: {session.project_path}",
+                branch_display=f"Branch: {branch}",
+                message_count_label=f"{message_count} messages",
+                total_tokens_label=f"{total_tokens} total tokens",
+                input_tokens_label=f"{input_tokens} in",
+                output_tokens_label=f"{output_tokens} out",
+                start_time_label=f"Started: {start_time}"
+            )
+            # Everything the filter pass compares, precomputed: counts,
+            # lowercased branch (empty when absent, so a branch filter
+            # can't match the "unknown" placeholder) and the start date
+            filter_meta[session_id] = (
+                message_count,
+                total_tokens,
+                input_tokens,
+                output_tokens,
+                (session.git_branch or "").lower(),
+                session.start_time.date().isoformat() if session.start_time else "",
+            )
+        # Store both dicts in most-recent-first order so apply_filters
+        # emits sorted results by construction and never re-sorts
+        ordered = sorted(summaries, key=lambda sid: summaries[sid].start_time, reverse=True)
+        self._summary_cache = {sid: summaries[sid] for sid in ordered}
+        self._filter_meta = {sid: filter_meta[sid] for sid in ordered}
+
     def load_data(self):
         """Load all sessions from configured claude_dir (metadata only, not messages)"""
         print(f"Loading session metadata from {rxconfig.claude_dir}...")
@@ -127,7 +216,8 @@ class State(rx.State):
                 cache.store_session_metadata(session_id, session)
 
         print(f"Loaded {len(sessions)} sessions (metadata only)")
-        self.apply_filters()
+        self._rebuild_summary_cache()
+        self.apply_filters(force=True)
 
     def refresh_session_list(self):
         """Refresh the session list by re-scanning the projects directory for new sessions"""
@@ -147,67 +237,100 @@ class State(rx.State):
                 # Only update metadata for sessions that haven't been loaded yet
                 cache.store_session_metadata(session_id, session)
 
+        # Batch-refresh cached file mtimes so staleness checks stay warm
+        projects_dir = rxconfig.claude_dir / "projects"
+        if projects_dir.exists():
+            for project_dir in projects_dir.iterdir():
+                if project_dir.is_dir():
+                    cache.refresh_mtimes_from_dir(project_dir)
+
         # Re-apply filters to include new sessions
-        self.apply_filters()
+        self._rebuild_summary_cache()
+        self.apply_filters(force=True)
 
         if new_session_count > 0:
             print(f"Found {new_session_count} new session(s)")
         else:
             print(f"No new sessions found (total: {len(sessions)})")
 
-    def apply_filters(self):
-        """Apply current filters to sessions"""
+    def apply_filters(self, force: bool = False):
+        """Apply current filters to sessions
+
+        Args:
+            force: Re-filter even if the filter values are unchanged
+                (callers that mutate all_sessions must pass True)
+        """
+        sig = (self.min_messages, self.max_messages,
+               self.min_tokens, self.max_tokens,
+               self.min_input_tokens, self.max_input_tokens,
+               self.min_output_tokens, self.max_output_tokens,
+               self.branch_filter, self.start_date_filter, self.end_date_filter)
+        if not force and sig == self._last_filter_sig:
+            return
+        self._last_filter_sig = sig
+
         filtered = []
+        branch_needle = self.branch_filter.lower()
+        start_date = self.start_date_filter
+        end_date = self.end_date_filter
+
+        # Hoist range bounds into locals and decide once per call whether
+        # each range can reject anything at all; ranges left at their
+        # defaults skip both comparisons for every session
+        min_messages, max_messages = self.min_messages, self.max_messages
+        min_tokens, max_tokens = self.min_tokens, self.max_tokens
+        min_input, max_input = self.min_input_tokens, self.max_input_tokens
+        min_output, max_output = self.min_output_tokens, self.max_output_tokens
+        check_messages = (min_messages != FILTER_DEFAULTS.min_messages
+                          or max_messages != FILTER_DEFAULTS.max_messages)
+        check_tokens = (min_tokens != FILTER_DEFAULTS.min_tokens
+                        or max_tokens != FILTER_DEFAULTS.max_tokens)
+        check_input = (min_input != FILTER_DEFAULTS.min_input_tokens
+                       or max_input != FILTER_DEFAULTS.max_input_tokens)
+        check_output = (min_output != FILTER_DEFAULTS.min_output_tokens
+                        or max_output != FILTER_DEFAULTS.max_output_tokens)
+
+        for session_id, meta in self._filter_meta.items():
+            message_count, total_tokens, input_tokens, output_tokens, branch_lower, session_date = meta
+
+            # Most selective filters first: a non-empty branch or date
+            # filter rejects far more sessions than the numeric ranges
+
+            # Apply branch filter
+            if branch_needle and branch_needle not in branch_lower:
+                continue
+
+            # Apply date range filter (based on start_time)
+            if session_date:
+                # Check start date
+                if start_date and session_date < start_date:
+                    continue
+
+                # Check end date
+                if end_date and session_date > end_date:
+                    continue
 
-        for session_id, session in self.all_sessions.items():
             # Apply message count filter
-            if session.message_count < self.min_messages or session.message_count > self.max_messages:
+            if check_messages and (message_count < min_messages or message_count > max_messages):
                 continue
 
             # Apply token count filter
-            if session.total_tokens < self.min_tokens or session.total_tokens > self.max_tokens:
+            if check_tokens and (total_tokens < min_tokens or total_tokens > max_tokens):
                 continue
 
             # Apply input token filter
-            if session.total_input_tokens < self.min_input_tokens or session.total_input_tokens > self.max_input_tokens:
+            if check_input and (input_tokens < min_input or input_tokens > max_input):
                 continue
 
             # Apply output token filter
-            if session.total_output_tokens < self.min_output_tokens or session.total_output_tokens > self.max_output_tokens:
-                continue
-
-            # Apply branch filter
-            if self.branch_filter and self.branch_filter.lower() not in (session.git_branch or "").lower():
+            if check_output and (output_tokens < min_output or output_tokens > max_output):
                 continue
 
-            # Apply date range filter (based on start_time)
-            if session.start_time:
-                session_date = session.start_time.date().isoformat()
-
-                # Check start date
-                if self.start_date_filter and session_date < self.start_date_filter:
-                    continue
-
-                # Check end date
-                if self.end_date_filter and session_date > self.end_date_filter:
-                    continue
-
-            summary = SessionSummary(
-                session_id=session_id,
-                description=session.description,
-                project_path=session.project_path,
-                git_branch=session.git_branch or "unknown",
-                message_count=session.message_count,
-                total_tokens=session.total_tokens,
-                input_tokens=session.total_input_tokens,
-                output_tokens=session.total_output_tokens,
-                start_time=session.start_time.isoformat() if session.start_time else "N/A"
-            )
-            filtered.append(summary)
+            filtered.append(self._summary_cache[session_id])
 
-        # Sort by start time, most recent first
-        filtered.sort(key=lambda s: s.start_time, reverse=True)
+        # Already most-recent-first: the caches iterate in sorted order
         self.filtered_sessions = filtered
+        self.session_list_page = 1  # New result set starts on its first page
 
     def set_numeric_filter(self, filter_name: str, value: str):
         """Generic method to update any numeric filter
@@ -248,20 +371,110 @@ class State(rx.State):
         self.current_page = 1  # Reset to first page when selecting a new session
         self.expanded_tool_results = set()  # Clear expanded tool results
 
-        # Load messages into cache if not already loaded
-        if not cache.is_session_loaded(session_id):
-            session = cache.get_session(session_id)
-            if session:
-                print(f"Loading messages for session {session_id}...")
-                messages = load_session_messages(session_id, session.project_dir, claude_dir=rxconfig.claude_dir)
+        # Load messages on demand, off the event thread so the UI stays
+        # responsive while a large file parses
+        if cache.is_session_loaded(session_id):
+            print(f"Session {session_id} messages already cached")
+            # A background load for a previously selected session may still
+            # be running; its completion handler only clears the flag for
+            # the session it loaded, so reset it here for the cached one
+            self.messages_loading = False
+        else:
+            self.messages_loading = True
+            return State.load_selected_session_messages
 
-                # Update the cached session with messages (NOT the State's session)
-                session.messages = messages
-                cache.cache_session(session_id, session, datetime.now())
+    @rx.event(background=True)
+    async def load_selected_session_messages(self):
+        """Load the selected session's messages without blocking the UI
 
-                print(f"Loaded {len(messages)} messages")
-        else:
-            print(f"Session {session_id} messages already cached")
+        Two stages: a quick head/tail sample is published first so large
+        sessions paint immediately, then the full parse replaces it. Both
+        run in worker threads via asyncio.to_thread.
+        """
+        session_id = self.selected_session_id
+        if not session_id:
+            return
+
+        session = cache.get_session(session_id)
+        if session is None or session.messages_loaded:
+            async with self:
+                if self.selected_session_id == session_id:
+                    self.messages_loading = False
+            return
+
+        print(f"Loading messages for session {session_id}...")
+        lite_messages, complete = await asyncio.to_thread(
+            load_session_messages_lite, session_id, session.project_dir)
+
+        if complete:
+            # The sample covered the whole file; store it as the full load
+            session.messages = lite_messages
+            session.invalidate_message_caches()
+            session.messages_loaded = True
+            cache.cache_session(session_id, session)
+            print(f"Loaded {len(lite_messages)} messages")
+            async with self:
+                if self.selected_session_id == session_id:
+                    self.messages_version += 1
+                    self.messages_loading = False
+            return
+
+        published_sample = False
+        if lite_messages:
+            # Publish the sample while the full parse runs; the session
+            # stays unloaded so the cache still performs the real load
+            session.messages = lite_messages
+            session.invalidate_message_caches()
+            async with self:
+                if self.selected_session_id == session_id:
+                    # Bumping the version dirties the message vars, which
+                    # is what actually re-renders the page with the sample
+                    self.messages_version += 1
+                    published_sample = True
+
+        loaded = await asyncio.to_thread(cache.load_session, session_id)
+        if loaded is not None:
+            print(f"Loaded {len(loaded.messages)} messages")
+        async with self:
+            if self.selected_session_id == session_id:
+                if published_sample:
+                    # The full load restamped tool_result indices over the
+                    # complete list, so sample-era expansions would land
+                    # on different blocks
+                    self.expanded_tool_results = set()
+                self.messages_version += 1
+                self.messages_loading = False
+
+    @rx.var(cache=True)
+    def session_list_total_pages(self) -> int:
+        """Get total number of sidebar pages for the filtered session list"""
+        return max(1, (len(self.filtered_sessions) + self.session_list_page_size - 1) // self.session_list_page_size)
+
+    @rx.var(cache=True)
+    def paginated_filtered_sessions(self) -> List[SessionSummary]:
+        """Get the current sidebar page of filtered sessions"""
+        start_idx = (self.session_list_page - 1) * self.session_list_page_size
+        return self.filtered_sessions[start_idx:start_idx + self.session_list_page_size]
+
+    @rx.var(cache=True)
+    def session_list_pagination(self) -> dict:
+        """Sidebar pagination flags and label, mirroring the message pager"""
+        return {
+            "at_first": self.session_list_page == 1,
+            "at_last": self.session_list_page >= self.session_list_total_pages,
+            "multiple": self.session_list_total_pages > 1,
+            "label": f"Page {self.session_list_page} of {self.session_list_total_pages}",
+        }
+
+    def next_session_list_page(self):
+        """Go to next page of the session list"""
+        if self.session_list_page < self.session_list_total_pages:
+            self.session_list_page += 1
+
+    def prev_session_list_page(self):
+        """Go to previous page of the session list"""
+        if self.session_list_page > 1:
+            self.session_list_page -= 1
 
     def next_page(self):
         """Go to next page of messages"""
@@ -310,10 +523,9 @@ class State(rx.State):
             parent_session = cache.get_session(self.selected_session_id)
             if parent_session:
                 print(f"Loading agent session {agent_id}...")
-                agent_session = load_agent_session(agent_id, parent_session.project_dir, claude_dir=rxconfig.claude_dir)
+                agent_session = cache.load_agent_session_cached(agent_id, self.selected_session_id, parent_session.project_dir)
 
                 if agent_session:
-                    cache.store_agent_session(agent_id, self.selected_session_id, agent_session)
                     print(f"Loaded agent with {len(agent_session.messages)} messages")
                 else:
                     print(f"Failed to load agent {agent_id}")
@@ -337,7 +549,8 @@ class State(rx.State):
 
                 # Update the cached session with fresh messages
                 session.messages = messages
-                cache.cache_session(self.selected_session_id, session, datetime.now())
+                session.invalidate_message_caches()
+                cache.cache_session(self.selected_session_id, session)
 
                 # Clear cached file mtime so it gets re-checked
                 cache.cache_file_mtime(self.selected_session_id, 0)
@@ -385,15 +598,17 @@ class State(rx.State):
         if not self.selected_session_id:
             return False
 
-        # Check if we have a load time for this session
-        load_time = cache.get_load_time(self.selected_session_id)
+        # Fetch the cache entry once (load time + mtime in a single lookup)
+        entry = cache.get_entry(self.selected_session_id)
+        load_time = entry.load_time if entry is not None else None
         if not load_time:
             return False
 
-        # Try to get cached mtime first to avoid file I/O
+        # Try the cached mtime first to avoid file I/O (misses when stale,
+        # which sends us down the stat-and-recache path below)
         cached_mtime = cache.get_cached_mtime(self.selected_session_id)
         if cached_mtime and cached_mtime > 0:
-            return cached_mtime > load_time.timestamp()
+            return cached_mtime > load_time
 
         # Only do file I/O if not cached
         session = self.all_sessions.get(self.selected_session_id)
@@ -407,21 +622,38 @@ class State(rx.State):
             mtime = session_file.stat().st_mtime
             # Cache it for next time
             cache.cache_file_mtime(self.selected_session_id, mtime)
-            return mtime > load_time.timestamp()
+            return mtime > load_time
 
         return False
 
     @rx.var
     def total_pages(self) -> int:
         """Get total number of pages for current session (parent or agent)"""
+        self.messages_version  # Dep: bumped when cached messages change
         session = self._get_current_session()
         if session and session.messages:
             return (len(session.messages) + self.page_size - 1) // self.page_size
         return 1
 
+    @rx.var(cache=True)
+    def pagination(self) -> dict:
+        """Pagination flags and label, derived once per page change
+
+        One cached dict feeds the four nav buttons and the page label, so
+        a page change triggers a single recompute instead of five
+        independent Var expressions over current_page/total_pages.
+        """
+        at_edge_last = self.current_page >= self.total_pages
+        return {
+            "at_first": self.current_page == 1,
+            "at_last": at_edge_last,
+            "label": f"Page {self.current_page} of {self.total_pages}",
+        }
+
     @rx.var
     def paginated_messages(self) -> List[SessionMessage]:
         """Get messages for the current page (parent or agent)"""
+        self.messages_version  # Dep: bumped when cached messages change
         session = self._get_current_session()
         if session and session.messages:
             start_idx = (self.current_page - 1) * self.page_size
@@ -0,0 +1,119 @@
+"""Tests for the session cache's eviction and demotion behavior"""
+
+import json
+
+import pytest
+
+import rxconfig
+from inspector_claude import cache
+from inspector_claude.indexer import Session, SessionMessage
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    """Give every test an empty slab and leave none behind"""
+    cache.clear_cache()
+    yield
+    cache.clear_cache()
+
+
+def _make_session(session_id: str, is_agent: bool = False) -> Session:
+    """Build a loaded session with one message"""
+    session = Session(
+        session_id=session_id,
+        project_path="",
+        project_dir="test-project",
+        is_agent=is_agent,
+        messages=[SessionMessage(uuid=f"{session_id}-m0", type="user",
+                                 timestamp="2025-01-01T00:00:00Z", content="hi")]
+    )
+    session.messages_loaded = True
+    return session
+
+
+def test_demote_lru_moves_entries_to_cold_tier():
+    """Demotion evicts oldest entries into the weak cold tier"""
+    sessions = [_make_session(f"s{i}") for i in range(4)]
+    for session in sessions:
+        cache.cache_session(session.session_id, session)
+
+    with cache._slab.lock:
+        cache._demote_lru(2)
+
+    assert len(cache._slab.hot) == 2
+    assert set(cache._slab.hot) == {"s2", "s3"}
+    # Still-referenced sessions stay reachable through the weak tier
+    assert cache._slab.cold.get("s0") is sessions[0]
+    assert cache._slab.cold.get("s1") is sessions[1]
+
+
+def test_demotion_does_not_mutate_sessions():
+    """Evicted Session objects keep their data; other owners may hold them"""
+    session = _make_session("s0", is_agent=True)
+    session.parent_session_id = "parent"
+    cache.cache_session("s0", session)
+    cache.cache_session("s1", _make_session("s1"))
+
+    with cache._slab.lock:
+        cache._demote_lru(1)
+
+    assert len(session.messages) == 1
+    assert session.parent_session_id == "parent"
+
+
+def test_demoted_session_promotes_back_to_hot():
+    """Accessing a demoted session returns the same object and re-heats it"""
+    session = _make_session("s0")
+    cache.cache_session("s0", session)
+    cache.cache_session("s1", _make_session("s1"))
+
+    with cache._slab.lock:
+        cache._demote_lru(0)
+    assert len(cache._slab.hot) == 0
+
+    promoted = cache.get_session("s0")
+    assert promoted is session
+    assert "s0" in cache._slab.hot
+
+
+def test_demotion_keeps_counters_consistent():
+    """Incremental loaded/message counters track demotions and promotions"""
+    sessions = [_make_session(f"s{i}") for i in range(3)]
+    for session in sessions:
+        cache.cache_session(session.session_id, session)
+    assert cache._slab.loaded_count == 3
+    assert cache._slab.total_messages == 3
+
+    with cache._slab.lock:
+        cache._demote_lru(1)
+    assert cache._slab.loaded_count == 1
+    assert cache._slab.total_messages == 1
+
+    cache.get_session("s0")
+    assert cache._slab.loaded_count == 2
+    assert cache._slab.total_messages == 2
+
+
+def test_agent_reload_after_eviction_stays_intact(tmp_path, monkeypatch):
+    """An evicted agent session comes back with its messages, not a shell"""
+    monkeypatch.setattr(rxconfig, "claude_dir", tmp_path)
+    project_dir = tmp_path / "projects" / "test-project"
+    project_dir.mkdir(parents=True)
+    (project_dir / "agent-abc12345.jsonl").write_text(json.dumps({
+        "uuid": "agent-msg-1", "type": "user",
+        "timestamp": "2025-01-01T12:01:00.000Z",
+        "sessionId": "parent-session-id", "agentId": "abc12345",
+        "isSidechain": True,
+        "message": {"role": "user", "content": "Search for files"}
+    }) + "\n")
+
+    first = cache.load_agent_session_cached("abc12345", "parent-session-id", "test-project")
+    assert first is not None and len(first.messages) == 1
+
+    with cache._slab.lock:
+        cache._demote_lru(0)
+
+    # The UI still holds `first`; the reload must not return a wiped object
+    second = cache.load_agent_session_cached("abc12345", "parent-session-id", "test-project")
+    assert second is first
+    assert len(second.messages) == 1
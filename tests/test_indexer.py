@@ -10,6 +10,7 @@ from inspector_claude.indexer import (
     extract_agent_metadata,
     load_sessions,
     load_session_messages,
+    load_session_messages_lite,
     load_agent_session,
     normalize_content_block,
     AgentMetadata,
@@ -297,6 +298,28 @@ def test_load_sessions_from_temp_dir(tmp_path, temp_session_file):
     assert len(session.messages) == 2  # user + assistant (summary not counted)
 
 
+def test_index_prunes_deleted_sessions(tmp_path):
+    """Index entries for deleted session files are dropped on the next scan"""
+    from inspector_claude.indexer import INDEX_FILENAME, _load_index
+
+    project_dir = tmp_path / "projects" / "test-project"
+    project_dir.mkdir(parents=True)
+    for name in ("keep", "gone"):
+        (project_dir / f"{name}.jsonl").write_text(json.dumps({
+            "type": "user", "uuid": f"{name}-1", "timestamp": "2025-01-01T12:00:00.000Z",
+            "message": {"role": "user", "content": "hello"}
+        }) + "\n")
+
+    load_sessions(claude_dir=tmp_path)
+    assert set(_load_index(tmp_path)) == {"keep", "gone"}
+
+    (project_dir / "gone.jsonl").unlink()
+    sessions = load_sessions(claude_dir=tmp_path)
+
+    assert set(sessions) == {"keep"}
+    assert set(_load_index(tmp_path)) == {"keep"}
+
+
 def test_load_sessions_with_messages(tmp_path, temp_session_file):
     """Test loading sessions with full message content"""
     projects_dir = tmp_path / "projects" / "test-project"
@@ -361,6 +384,72 @@ def test_load_agent_session_not_found(tmp_path):
 
 # Tests for Session properties
 
+def test_load_session_messages_lite_small_file(tmp_path, temp_session_file):
+    """Test that small files are loaded in full and marked complete"""
+    projects_dir = tmp_path / "projects" / "test-project"
+    projects_dir.mkdir(parents=True)
+
+    import shutil
+    shutil.move(str(temp_session_file), str(projects_dir / temp_session_file.name))
+
+    messages, complete = load_session_messages_lite("test-session-id", "test-project", claude_dir=tmp_path)
+
+    assert complete is True
+    assert len(messages) == 2
+
+
+def test_load_session_messages_lite_large_file(tmp_path):
+    """Test that large files return head and tail messages, marked incomplete"""
+    projects_dir = tmp_path / "projects" / "test-project"
+    projects_dir.mkdir(parents=True)
+
+    # Build a file much larger than the 1 KiB head + 1 KiB tail windows
+    lines = []
+    for i in range(200):
+        lines.append(json.dumps({
+            "uuid": f"msg-{i}",
+            "type": "user",
+            "timestamp": "2025-01-01T12:00:00.000Z",
+            "message": {"role": "user", "content": f"message {i} " + "x" * 100}
+        }))
+    (projects_dir / "big-session.jsonl").write_text("\n".join(lines))
+
+    messages, complete = load_session_messages_lite(
+        "big-session", "test-project", claude_dir=tmp_path, head_kb=1, tail_kb=1
+    )
+
+    assert complete is False
+    assert 0 < len(messages) < 200
+    # The sample covers the start and the end of the file
+    assert messages[0].uuid == "msg-0"
+    assert messages[-1].uuid == "msg-199"
+
+
+def test_tool_result_indices_are_dense(tmp_path):
+    """tool_result blocks get sequential tool_result_idx values on load"""
+    project_dir = tmp_path / "projects" / "test-project"
+    project_dir.mkdir(parents=True)
+    lines = []
+    for i in range(3):
+        lines.append(json.dumps({
+            "type": "user", "uuid": f"msg-{i}", "timestamp": "2025-01-01T00:00:00Z",
+            "message": {"role": "user", "content": [
+                {"type": "tool_result", "tool_use_id": f"toolu_{i}", "content": "ok"}
+            ]}
+        }))
+    (project_dir / "sess.jsonl").write_text("\n".join(lines) + "\n")
+
+    messages = load_session_messages("sess", "test-project", claude_dir=tmp_path)
+
+    indices = [
+        block["tool_result_idx"]
+        for msg in messages
+        for block in (msg.content_blocks or [])
+        if block["type"] == "tool_result"
+    ]
+    assert indices == [0, 1, 2]
+
+
 def test_session_message_count():
     """Test session message_count property"""
     session = Session(